@@ -4,40 +4,100 @@ import os
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from neo4j import GraphDatabase
-from src.config import settings
+from neo4j.exceptions import Neo4jError
 
-def main():
+from src.neo4j_driver import get_neo4j_driver, close_neo4j_driver
+from src.event_loop import install_event_loop_policy
+
+# Preferred path: APOC reads Neo4j's in-memory counters instead of scanning the store.
+APOC_STATS_QUERY = """
+CALL apoc.meta.stats() YIELD nodeCount, relCount, labels, relTypesCount
+RETURN nodeCount, relCount, labels, relTypesCount
+"""
+
+# Fallback when APOC is not installed: node count, relationship count and a
+# sample of labels in a single round-trip. Every branch tags its rows with a
+# `kind` column so they can be split apart client-side.
+GRAPH_SUMMARY_QUERY = """
+MATCH (n) RETURN 'nodes' AS kind, count(n) AS value
+UNION ALL
+MATCH ()-[r]->() RETURN 'relationships' AS kind, count(r) AS value
+UNION ALL
+MATCH (n) WITH DISTINCT labels(n) AS labels LIMIT 5
+RETURN 'labels' AS kind, labels AS value
+"""
+
+async def fetch_apoc_stats(session) -> list:
+    """Counts and per-label / per-type breakdowns from apoc.meta.stats()."""
+    result = await session.run(APOC_STATS_QUERY)
+    record = await result.single()
+    
+    out = [f"Nodes: {record['nodeCount']}", f"Relationships: {record['relCount']}"]
+    
+    if record["labels"]:
+        out.append("Labels:")
+        out.extend(f" - {label}: {count}" for label, count in record["labels"].items())
+    if record["relTypesCount"]:
+        out.append("Relationship Types:")
+        out.extend(f" - {rel_type}: {count}" for rel_type, count in record["relTypesCount"].items())
+    
+    return out
+
+
+async def fetch_graph_summary(session) -> list:
+    """Counts and a sample of labels via plain Cypher."""
+    node_count = 0
+    rel_count = 0
+    sample_labels = []
+    
+    result = await session.run(GRAPH_SUMMARY_QUERY)
+    records = await result.data()
+    
+    for record in records:
+        kind = record["kind"]
+        if kind == "nodes":
+            node_count = record["value"]
+        elif kind == "relationships":
+            rel_count = record["value"]
+        else:
+            sample_labels.append(record["value"])
+    
+    out = [f"Nodes: {node_count}", f"Relationships: {rel_count}"]
+    
+    if sample_labels:
+        out.append("Sample Labels:")
+        out.extend(f" - {labels}" for labels in sample_labels)
+    
+    return out
+
+
+async def check_graph():
+    """Print graph counts using the shared driver (left open for the caller)."""
     print("Checking Neo4j content...")
     
-    uri = settings.neo4j_uri
-    user = settings.neo4j_username
-    password = settings.neo4j_password
     database = "neo4j" # Forced in rag_config
     
     try:
-        driver = GraphDatabase.driver(uri, auth=(user, password))
-        with driver.session(database=database) as session:
-            # Count nodes
-            result = session.run("MATCH (n) RETURN count(n) as count")
-            node_count = result.single()["count"]
-            print(f"Nodes: {node_count}")
+        driver = await get_neo4j_driver()
+        # Summary output is tiny; pull every row in a single PULL message
+        async with driver.session(database=database, fetch_size=1000) as session:
+            try:
+                out = await fetch_apoc_stats(session)
+            except Neo4jError:
+                # APOC not installed
+                out = await fetch_graph_summary(session)
             
-            # Count relationships
-            result = session.run("MATCH ()-[r]->() RETURN count(r) as count")
-            rel_count = result.single()["count"]
-            print(f"Relationships: {rel_count}")
-            
-            # Sample some labels
-            if node_count > 0:
-                result = session.run("MATCH (n) RETURN distinct labels(n) as labels LIMIT 5")
-                print("Sample Labels:")
-                for r in result:
-                    print(f" - {r['labels']}")
-
-        driver.close()
+            sys.stdout.write("\n".join(out) + "\n")
     except Exception as e:
         print(f"Error checking Neo4j: {e}")
 
+
+async def main():
+    try:
+        await check_graph()
+    finally:
+        await close_neo4j_driver()
+
 if __name__ == "__main__":
-    main()
+    install_event_loop_policy()
+    asyncio.run(main())
@@ -2,6 +2,8 @@
 import asyncio
 import asyncpg
 import sys
+from functools import lru_cache
+from pathlib import Path
 
 # Docker Config (confirmed working)
 config = {
@@ -11,48 +13,121 @@ config = {
     'port': 5432
 }
 
+SCHEMA_FILE = Path(__file__).parent / "setup_postgres.sql"
+
+# Fail fast when the container is down instead of waiting on default timeouts
+CONNECT_TIMEOUT = 5.0
+
+# One small pool per target database, reused by every step that touches it
+_pools = {}
+
+async def get_db_pool(db_name):
+    """Get or create the connection pool for db_name."""
+    if db_name not in _pools:
+        _pools[db_name] = await asyncpg.create_pool(
+            database=db_name, min_size=1, max_size=4, timeout=CONNECT_TIMEOUT, **config
+        )
+    return _pools[db_name]
+
+async def close_db_pools():
+    """Close every pool opened by get_db_pool."""
+    while _pools:
+        _, pool = _pools.popitem()
+        await pool.close()
+
 async def setup_database():
     print("🔌 Connecting to 'postgres' database...")
     # Connect to default 'postgres' db to manage databases
-    sys_conn = await asyncpg.connect(database='postgres', **config)
+    # One-shot admin session: nothing worth caching as a prepared statement
+    sys_conn = await asyncpg.connect(
+        database='postgres', timeout=CONNECT_TIMEOUT, command_timeout=30.0,
+        statement_cache_size=0, **config
+    )
     
-    # Check if 'ats_resume' exists
-    exists = await sys_conn.fetchval("SELECT 1 FROM pg_database WHERE datname = 'ats_resume'")
-    if not exists:
-        print("🛠️ Database 'ats_resume' not found. Creating it...")
+    # CREATE DATABASE has no IF NOT EXISTS (and cannot run inside DO), so just
+    # attempt it: one round-trip whether or not 'ats_resume' is already there
+    try:
         await sys_conn.execute('CREATE DATABASE ats_resume')
         print("✅ Database 'ats_resume' created!")
-    else:
+    except asyncpg.DuplicateDatabaseError:
         print("✅ Database 'ats_resume' already exists.")
     
+    # While the admin session is open, learn whether the optional 'ats_db'
+    # target exists so main() doesn't pay a failing connect to find out
+    has_ats_db = await sys_conn.fetchval(
+        "SELECT EXISTS(SELECT 1 FROM pg_database WHERE datname = 'ats_db')"
+    )
+    
     await sys_conn.close()
+    return has_ats_db
+
+def split_sql_statements(sql):
+    """
+    Split a SQL script into individual statements.
+    
+    Drops "--" comments and splits on semicolons outside single-quoted strings.
+    Dollar-quoted bodies are not supported (setup_postgres.sql has none).
+    """
+    statements = []
+    current = []
+    in_string = False
+    i = 0
+    
+    while i < len(sql):
+        ch = sql[i]
+        if in_string:
+            current.append(ch)
+            if ch == "'":
+                in_string = False
+        elif ch == "'":
+            in_string = True
+            current.append(ch)
+        elif sql.startswith("--", i):
+            newline = sql.find("\n", i)
+            i = len(sql) if newline == -1 else newline
+            continue
+        elif ch == ";":
+            statements.append("".join(current).strip())
+            current = []
+        else:
+            current.append(ch)
+        i += 1
+    
+    statements.append("".join(current).strip())
+    return [stmt for stmt in statements if stmt]
+
+@lru_cache(maxsize=1)
+def load_schema_statements():
+    """Read and split setup_postgres.sql once; every target database reuses it."""
+    return tuple(split_sql_statements(SCHEMA_FILE.read_text(encoding="utf-8")))
 
 async def setup_schema_for_db(db_name):
     print(f"\n🔌 Connecting to '{db_name}' database...")
     # Connect to target db
-    config_copy = config.copy()
-    conn = await asyncpg.connect(database=db_name, **config_copy)
+    pool = await get_db_pool(db_name)
     
     print("📜 Running schema setup script...")
-    with open('scripts/setup_postgres.sql', 'r') as f:
-        sql = f.read()
-        
-    # Split by statements (simple split by ;) - actually asyncpg execute can handle blocks usually
-    # But let's just run the whole thing if it's compatible
-    # Removing "--" comments might be safer for simple execution
+    statements = load_schema_statements()
+    
+    # Run statement by statement inside one transaction so a failure names
+    # the offending statement and still leaves the schema untouched
+    statement = None
     try:
-        await conn.execute(sql)
+        async with pool.acquire() as conn:
+            async with conn.transaction():
+                for statement in statements:
+                    await conn.execute(statement)
         print(f"✅ Schema created successfully in {db_name}!")
     except Exception as e:
-        print(f"⚠️ Schema setup warning in {db_name}: {e}")
+        failed = f" while running: {statement.splitlines()[0]}" if statement else ""
+        print(f"⚠️ Schema setup warning in {db_name}{failed}: {e}")
 
-    await conn.close()
     return True
 
 async def main():
     try:
         # Create ats_resume if missing
-        await setup_database()
+        has_ats_db = await setup_database()
         
         # Apply schema to ats_resume
         print("\n--- Setup ats_resume ---")
@@ -60,18 +135,24 @@ async def main():
         
         # Apply schema to ats_db (if exists) just in case config points there
         print("\n--- Setup ats_db ---")
-        try:
-           await setup_schema_for_db('ats_db')
-        except Exception as e:
-           print(f"Skipping ats_db: {e}")
+        if has_ats_db:
+            try:
+                await setup_schema_for_db('ats_db')
+            except Exception as e:
+                print(f"Skipping ats_db: {e}")
+        else:
+            print("Skipping ats_db: database does not exist")
 
         print("\n🎉 ALL DONE! PostgreSQL is ready to use.")
         return True
     except Exception as e:
         print(f"\n❌ FATAL ERROR: {e}")
         return False
+    finally:
+        await close_db_pools()
 
 if __name__ == "__main__":
-    if sys.platform == 'win32':
-        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    from src.event_loop import install_event_loop_policy
+    install_event_loop_policy()
     asyncio.run(main())
@@ -1,9 +1,10 @@
-import requests
+import httpx
 import csv
 import os
-import io
 import random
+import sys
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 # Direct raw link to the CSV file on Hugging Face
 DATASET_URL = "https://huggingface.co/datasets/AzharAli05/Resume-Screening-Dataset/resolve/main/dataset.csv"
@@ -12,33 +13,63 @@ FALLBACK_URL = "https://huggingface.co/datasets/AzharAli05/Resume-Screening-Data
 
 OUTPUT_DIR = "data/real_resumes"
 
+# Total resumes to sample, balanced across categories
+TOTAL_RESUMES = 50
+
+def iter_csv_lines(response):
+    """
+    Yield the response body line by line, keeping line endings.
+    
+    csv needs the newlines to rebuild quoted multi-line fields (resume text),
+    which httpx's iter_lines() would strip.
+    """
+    pending = ""
+    for chunk in response.iter_text():
+        pending += chunk
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line + "\n"
+    if pending:
+        yield pending
+
+def clean_resume_text(text):
+    """Turn literal "\\n" escapes (a CSV artifact) into newlines and trim."""
+    return text.replace('\\n', '\n').strip()
+
+def write_resume(item):
+    filepath, text = item
+    # Clean and encode in the worker; binary mode skips the text-layer encoder
+    with open(filepath, "wb") as f:
+        f.write(clean_resume_text(text).encode("utf-8"))
+    return filepath
+
 def download_and_process():
     print(f"Downloading dataset...")
     
-    response = requests.get(DATASET_URL)
-    if response.status_code != 200:
-        print(f"Primary URL failed ({response.status_code}). Trying fallback...")
-        response = requests.get(FALLBACK_URL)
-        if response.status_code != 200:
-            print(f"Failed to download dataset. Status: {response.status_code}")
-            return
+    # Stream the CSV straight into the parser instead of buffering the payload
+    with httpx.Client(follow_redirects=True, timeout=60.0) as client:
+        with client.stream("GET", DATASET_URL) as response:
+            if response.status_code == 200:
+                return process_rows(csv.DictReader(iter_csv_lines(response)))
+            print(f"Primary URL failed ({response.status_code}). Trying fallback...")
+        
+        with client.stream("GET", FALLBACK_URL) as response:
+            if response.status_code != 200:
+                print(f"Failed to download dataset. Status: {response.status_code}")
+                return
+            return process_rows(csv.DictReader(iter_csv_lines(response)))
 
-    content = response.content.decode('utf-8')
-    csv_reader = csv.DictReader(io.StringIO(content))
-    
+def process_rows(csv_reader):
     # Group by category
     categories = defaultdict(list)
-    rows = list(csv_reader)
-    
-    print(f"Total rows found: {len(rows)}")
     
     # normalize column names
     # Expecting 'Resume_str' or 'Resume' and 'Category'
     resume_key = None
     category_key = None
     
-    if rows:
-        keys = rows[0].keys()
+    keys = csv_reader.fieldnames
+    if keys:
         print(f"Columns found: {list(keys)}")
         for k in keys:
             k_lower = k.lower()
@@ -51,22 +82,33 @@ def download_and_process():
         print("Could not identify Resume column.")
         return
 
-    for row in rows:
+    # Single pass. The per-category quota (TOTAL_RESUMES // n_categories) is
+    # only known at the end, but it never exceeds TOTAL_RESUMES, so rows past
+    # that in any category are counted and dropped instead of kept in memory
+    total_rows = 0
+    for row in csv_reader:
+        total_rows += 1
         cat = row[category_key] if category_key else "Uncategorized"
-        text = row[resume_key]
-        categories[cat].append(text)
+        bucket = categories[cat]
+        if len(bucket) < TOTAL_RESUMES:
+            bucket.append(row[resume_key])
     
+    print(f"Total rows found: {total_rows}")
     print(f"Found {len(categories)} categories.")
     
+    if not categories:
+        print("No resume rows found.")
+        return
+    
     # ensure output dir exists
     if not os.path.exists(OUTPUT_DIR):
         os.makedirs(OUTPUT_DIR)
         
-    # Select 50 resumes balanced
+    # Select TOTAL_RESUMES resumes balanced
     selected = []
     
     # Calculate target per category
-    target_per_cat = max(1, 50 // len(categories))
+    target_per_cat = max(1, TOTAL_RESUMES // len(categories))
     
     for cat, resumes in categories.items():
         # Clean category name for filename
@@ -78,19 +120,20 @@ def download_and_process():
             filename = f"{safe_cat}_{i+1}.txt"
             filepath = os.path.join(OUTPUT_DIR, filename)
             
-            # Clean text (sometimes CSVs have artifacts)
-            clean_text = text.replace('\\n', '\n').strip()
-            
-            with open(filepath, "w", encoding="utf-8") as f:
-                f.write(clean_text)
+            selected.append((filepath, text))
             
-            print(f"Saved: {filename}")
-            selected.append(filepath)
-            
-            if len(selected) >= 50:
+            if len(selected) >= TOTAL_RESUMES:
                 break
-        if len(selected) >= 50:
+        if len(selected) >= TOTAL_RESUMES:
             break
+    
+    # Write the selected files concurrently rather than one blocking write at a time
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        saved = [f"Saved: {os.path.basename(filepath)}" for filepath in pool.map(write_resume, selected)]
+    
+    # One write for the whole listing instead of a print per file
+    if saved:
+        sys.stdout.write("\n".join(saved) + "\n")
             
     print(f"Successfully saved {len(selected)} resumes to {OUTPUT_DIR}")
 
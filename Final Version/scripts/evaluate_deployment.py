@@ -6,11 +6,168 @@ Tests all API endpoints and validates responses.
 import asyncio
 import httpx
 import json
+import sys
 import time
 from datetime import datetime
+from pathlib import Path
 
 BASE_URL = "http://127.0.0.1:8000"
 
+# Concurrent probes share keep-alive connections; fail fast if the server is down.
+# (HTTP/2 is not enabled: uvicorn serves plain-text HTTP/1.1 only.)
+CLIENT_TIMEOUT = httpx.Timeout(180.0, connect=10.0)
+CLIENT_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=20)
+
+
+# Each probe returns (passed, detail, lines). Probes run concurrently, so they
+# collect their output and run_evaluation prints it in test order afterwards.
+
+async def probe_health(client):
+    lines = ["📋 TEST 1: Health Check"]
+    try:
+        start = time.perf_counter()
+        resp = await client.get(f"{BASE_URL}/health")
+        elapsed = time.perf_counter() - start
+        
+        if resp.status_code == 200:
+            data = resp.json()
+            lines.append(f"   ✅ Status: {data.get('status')}")
+            lines.append(f"   ✅ RAG: {data.get('components', {}).get('rag')}")
+            lines.append(f"   ✅ Ollama: {data.get('components', {}).get('ollama')}")
+            lines.append(f"   ⏱️  Response time: {elapsed:.2f}s")
+            return True, {"test": "health", "status": "PASS"}, lines
+        lines.append(f"   ❌ Failed: {resp.status_code}")
+        return False, {"test": "health", "status": "FAIL"}, lines
+    except Exception as e:
+        lines.append(f"   ❌ Error: {e}")
+        return False, None, lines
+
+
+async def probe_analyze(client):
+    lines = ["📋 TEST 2: Job Analysis (/analyze)"]
+    try:
+        resp = await client.post(
+            f"{BASE_URL}/analyze",
+            json={
+                "job_id": "eval-001",
+                "query": "Python developer with AWS and SQL experience",
+                "top_k": 5
+            }
+        )
+        
+        if resp.status_code == 200:
+            data = resp.json()
+            candidates = data.get("candidates", [])
+            lines.append(f"   ✅ Candidates found: {data.get('candidates_found')}")
+            lines.append(f"   ✅ Processing time: {data.get('processing_time', 0):.2f}s")
+            
+            # Check candidate format
+            if candidates:
+                c = candidates[0]
+                lines.append(f"   ✅ Candidate format OK:")
+                lines.append(f"      - name: {c.get('name', 'N/A')}")
+                lines.append(f"      - score: {c.get('score', 'N/A')}")
+                lines.append(f"      - match_reason: {c.get('match_reason', 'N/A')}")
+                lines.append(f"      - skills_matched: {c.get('skills_matched', [])}")
+            
+            return True, {"test": "analyze", "status": "PASS", "candidates": len(candidates)}, lines
+        lines.append(f"   ❌ Failed: {resp.status_code} - {resp.text}")
+        return False, None, lines
+    except Exception as e:
+        lines.append(f"   ❌ Error: {e}")
+        return False, None, lines
+
+
+async def probe_chat_job(client):
+    lines = ["📋 TEST 3: Job Chat (/chat/job)"]
+    try:
+        resp = await client.post(
+            f"{BASE_URL}/chat/job",
+            json={
+                "job_id": "eval-001",
+                "message": "List the top candidates with their skills"
+            }
+        )
+        
+        if resp.status_code == 200:
+            data = resp.json()
+            response_text = data.get("response", "")
+            lines.append(f"   ✅ Response length: {len(response_text)} chars")
+            lines.append(f"   ✅ Mode used: {data.get('mode_used')}")
+            lines.append(f"   ✅ Processing time: {data.get('processing_time', 0):.2f}s")
+            
+            # Check for incomplete response
+            if response_text.endswith(":"):
+                lines.append(f"   ⚠️  WARNING: Response may be truncated (ends with ':')")
+                detail = {"test": "chat_job", "status": "WARN", "issue": "truncated"}
+            else:
+                lines.append(f"   ✅ Response complete")
+                detail = {"test": "chat_job", "status": "PASS"}
+            
+            # Show preview
+            preview = response_text[:200] + "..." if len(response_text) > 200 else response_text
+            lines.append(f"   📝 Preview: {preview}")
+            
+            return True, detail, lines
+        lines.append(f"   ❌ Failed: {resp.status_code}")
+        return False, None, lines
+    except Exception as e:
+        lines.append(f"   ❌ Error: {e}")
+        return False, None, lines
+
+
+async def probe_direct_query(client):
+    lines = ["📋 TEST 4: Direct Query (/chat/query)"]
+    try:
+        resp = await client.post(
+            f"{BASE_URL}/chat/query",
+            json={
+                "query": "Who has experience with databases?"
+            }
+        )
+        
+        if resp.status_code == 200:
+            data = resp.json()
+            lines.append(f"   ✅ Response length: {len(data.get('response', ''))} chars")
+            lines.append(f"   ✅ Processing time: {data.get('processing_time', 0):.2f}s")
+            return True, {"test": "direct_query", "status": "PASS"}, lines
+        lines.append(f"   ❌ Failed: {resp.status_code}")
+        return False, None, lines
+    except Exception as e:
+        lines.append(f"   ❌ Error: {e}")
+        return False, None, lines
+
+
+async def probe_get_analysis(client):
+    lines = ["📋 TEST 5: Get Stored Analysis (/analyze/{job_id})"]
+    try:
+        resp = await client.get(f"{BASE_URL}/analyze/eval-001")
+        
+        if resp.status_code == 200:
+            data = resp.json()
+            lines.append(f"   ✅ Retrieved job: {data.get('job_id')}")
+            lines.append(f"   ✅ Candidates stored: {data.get('candidates_found')}")
+            return True, {"test": "get_analysis", "status": "PASS"}, lines
+        lines.append(f"   ❌ Failed: {resp.status_code}")
+        return False, None, lines
+    except Exception as e:
+        lines.append(f"   ❌ Error: {e}")
+        return False, None, lines
+
+
+async def probe_docs(client):
+    lines = ["📋 TEST 6: API Documentation (/docs)"]
+    try:
+        resp = await client.get(f"{BASE_URL}/docs")
+        if resp.status_code == 200:
+            lines.append(f"   ✅ Swagger UI accessible")
+            return True, {"test": "docs", "status": "PASS"}, lines
+        lines.append(f"   ❌ Failed: {resp.status_code}")
+        return False, None, lines
+    except Exception as e:
+        lines.append(f"   ❌ Error: {e}")
+        return False, None, lines
+
 
 async def run_evaluation():
     """Run comprehensive deployment evaluation."""
@@ -26,172 +183,26 @@ async def run_evaluation():
         "details": []
     }
     
-    async with httpx.AsyncClient(timeout=180.0) as client:
-        
-        # ===== TEST 1: Health Check =====
-        print("📋 TEST 1: Health Check")
-        try:
-            start = time.time()
-            resp = await client.get(f"{BASE_URL}/health")
-            elapsed = time.time() - start
-            
-            if resp.status_code == 200:
-                data = resp.json()
-                print(f"   ✅ Status: {data.get('status')}")
-                print(f"   ✅ RAG: {data.get('components', {}).get('rag')}")
-                print(f"   ✅ Ollama: {data.get('components', {}).get('ollama')}")
-                print(f"   ⏱️  Response time: {elapsed:.2f}s")
-                results["tests_passed"] += 1
-                results["details"].append({"test": "health", "status": "PASS"})
-            else:
-                print(f"   ❌ Failed: {resp.status_code}")
-                results["tests_failed"] += 1
-                results["details"].append({"test": "health", "status": "FAIL"})
-        except Exception as e:
-            print(f"   ❌ Error: {e}")
-            results["tests_failed"] += 1
-        print()
-        
-        # ===== TEST 2: Analyze Endpoint =====
-        print("📋 TEST 2: Job Analysis (/analyze)")
-        try:
-            start = time.time()
-            resp = await client.post(
-                f"{BASE_URL}/analyze",
-                json={
-                    "job_id": "eval-001",
-                    "query": "Python developer with AWS and SQL experience",
-                    "top_k": 5
-                }
-            )
-            elapsed = time.time() - start
-            
-            if resp.status_code == 200:
-                data = resp.json()
-                candidates = data.get("candidates", [])
-                print(f"   ✅ Candidates found: {data.get('candidates_found')}")
-                print(f"   ✅ Processing time: {data.get('processing_time', 0):.2f}s")
-                
-                # Check candidate format
-                if candidates:
-                    c = candidates[0]
-                    print(f"   ✅ Candidate format OK:")
-                    print(f"      - name: {c.get('name', 'N/A')}")
-                    print(f"      - score: {c.get('score', 'N/A')}")
-                    print(f"      - match_reason: {c.get('match_reason', 'N/A')}")
-                    print(f"      - skills_matched: {c.get('skills_matched', [])}")
-                
-                results["tests_passed"] += 1
-                results["details"].append({"test": "analyze", "status": "PASS", "candidates": len(candidates)})
-            else:
-                print(f"   ❌ Failed: {resp.status_code} - {resp.text}")
-                results["tests_failed"] += 1
-        except Exception as e:
-            print(f"   ❌ Error: {e}")
-            results["tests_failed"] += 1
-        print()
-        
-        # ===== TEST 3: Chat Job Endpoint =====
-        print("📋 TEST 3: Job Chat (/chat/job)")
-        try:
-            start = time.time()
-            resp = await client.post(
-                f"{BASE_URL}/chat/job",
-                json={
-                    "job_id": "eval-001",
-                    "message": "List the top candidates with their skills"
-                }
-            )
-            elapsed = time.time() - start
-            
-            if resp.status_code == 200:
-                data = resp.json()
-                response_text = data.get("response", "")
-                print(f"   ✅ Response length: {len(response_text)} chars")
-                print(f"   ✅ Mode used: {data.get('mode_used')}")
-                print(f"   ✅ Processing time: {data.get('processing_time', 0):.2f}s")
-                
-                # Check for incomplete response
-                if response_text.endswith(":"):
-                    print(f"   ⚠️  WARNING: Response may be truncated (ends with ':')")
-                    results["details"].append({"test": "chat_job", "status": "WARN", "issue": "truncated"})
-                else:
-                    print(f"   ✅ Response complete")
-                    results["details"].append({"test": "chat_job", "status": "PASS"})
-                
-                # Show preview
-                preview = response_text[:200] + "..." if len(response_text) > 200 else response_text
-                print(f"   📝 Preview: {preview}")
-                
-                results["tests_passed"] += 1
-            else:
-                print(f"   ❌ Failed: {resp.status_code}")
-                results["tests_failed"] += 1
-        except Exception as e:
-            print(f"   ❌ Error: {e}")
-            results["tests_failed"] += 1
-        print()
-        
-        # ===== TEST 4: Direct Query Endpoint =====
-        print("📋 TEST 4: Direct Query (/chat/query)")
-        try:
-            start = time.time()
-            resp = await client.post(
-                f"{BASE_URL}/chat/query",
-                json={
-                    "query": "Who has experience with databases?"
-                }
-            )
-            elapsed = time.time() - start
-            
-            if resp.status_code == 200:
-                data = resp.json()
-                print(f"   ✅ Response length: {len(data.get('response', ''))} chars")
-                print(f"   ✅ Processing time: {data.get('processing_time', 0):.2f}s")
-                results["tests_passed"] += 1
-                results["details"].append({"test": "direct_query", "status": "PASS"})
-            else:
-                print(f"   ❌ Failed: {resp.status_code}")
-                results["tests_failed"] += 1
-        except Exception as e:
-            print(f"   ❌ Error: {e}")
-            results["tests_failed"] += 1
-        print()
-        
-        # ===== TEST 5: Get Job Analysis =====
-        print("📋 TEST 5: Get Stored Analysis (/analyze/{job_id})")
-        try:
-            resp = await client.get(f"{BASE_URL}/analyze/eval-001")
-            
-            if resp.status_code == 200:
-                data = resp.json()
-                print(f"   ✅ Retrieved job: {data.get('job_id')}")
-                print(f"   ✅ Candidates stored: {data.get('candidates_found')}")
-                results["tests_passed"] += 1
-                results["details"].append({"test": "get_analysis", "status": "PASS"})
-            else:
-                print(f"   ❌ Failed: {resp.status_code}")
-                results["tests_failed"] += 1
-        except Exception as e:
-            print(f"   ❌ Error: {e}")
-            results["tests_failed"] += 1
-        print()
-        
-        # ===== TEST 6: API Docs =====
-        print("📋 TEST 6: API Documentation (/docs)")
-        try:
-            resp = await client.get(f"{BASE_URL}/docs")
-            if resp.status_code == 200:
-                print(f"   ✅ Swagger UI accessible")
-                results["tests_passed"] += 1
-                results["details"].append({"test": "docs", "status": "PASS"})
-            else:
-                print(f"   ❌ Failed: {resp.status_code}")
-                results["tests_failed"] += 1
-        except Exception as e:
-            print(f"   ❌ Error: {e}")
-            results["tests_failed"] += 1
+    async with httpx.AsyncClient(timeout=CLIENT_TIMEOUT, limits=CLIENT_LIMITS) as client:
+        # Independent probes run together; /chat/job and /analyze/{job_id}
+        # read the job that /analyze stores, so they wait for it
+        health, analyze, direct_query, docs = await asyncio.gather(
+            probe_health(client),
+            probe_analyze(client),
+            probe_direct_query(client),
+            probe_docs(client)
+        )
+        chat_job, get_analysis = await asyncio.gather(
+            probe_chat_job(client),
+            probe_get_analysis(client)
+        )
+    
+    for passed, detail, lines in (health, analyze, chat_job, direct_query, get_analysis, docs):
+        print("\n".join(lines))
         print()
+        results["tests_passed" if passed else "tests_failed"] += 1
+        if detail:
+            results["details"].append(detail)
     
     # ===== SUMMARY =====
     print("=" * 60)
@@ -218,4 +229,7 @@ async def run_evaluation():
 
 
 if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    from src.event_loop import install_event_loop_policy
+    install_event_loop_policy()
     asyncio.run(run_evaluation())
@@ -87,5 +87,8 @@ if __name__ == "__main__":
     )
     
     args = parser.parse_args()
+    
+    from src.event_loop import install_event_loop_policy
+    install_event_loop_policy()
     success = asyncio.run(main(args))
     sys.exit(0 if success else 1)
@@ -4,46 +4,71 @@ Verifies connections and initializes LightRAG storages.
 """
 
 import asyncio
+import functools
 import sys
+import time
 from pathlib import Path
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-import asyncpg
-from neo4j import AsyncGraphDatabase
+# Optional - the resource module is POSIX-only
+try:
+    import resource
+    HAS_RESOURCE = True
+except ImportError:
+    HAS_RESOURCE = False
+
+
+def _peak_rss_kb() -> int:
+    """Peak resident set size in KB (ru_maxrss is bytes on macOS)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def timed(fn):
+    """
+    Print wall time (and peak-RSS growth where available) for an init step.
+    
+    ru_maxrss is a process-wide peak, so only wrap steps that run on their
+    own; concurrent probes are measured together via run_probes.
+    """
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        rss_before = _peak_rss_kb() if HAS_RESOURCE else None
+        start = time.perf_counter()
+        try:
+            return await fn(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            rss = f", peak RSS +{_peak_rss_kb() - rss_before} KB" if HAS_RESOURCE else ""
+            print(f"   [{fn.__name__}] {elapsed:.2f}s{rss}")
+    return wrapper
 
 
 async def check_postgres():
     """Check PostgreSQL connection and pgvector extension."""
-    from src.config import settings
+    from src.db_pool import get_pg_pool
     
     print("Checking PostgreSQL...")
     
     try:
-        # Parse connection string
-        conn = await asyncpg.connect(
-            host=settings.postgres_host,
-            port=settings.postgres_port,
-            user=settings.postgres_user,
-            password=settings.postgres_password,
-            database=settings.postgres_db
-        )
+        pool = await get_pg_pool()
         
-        # Check pgvector extension
-        result = await conn.fetchval(
-            "SELECT EXISTS(SELECT 1 FROM pg_extension WHERE extname = 'vector')"
-        )
-        
-        if not result:
-            print("📦 Creating pgvector extension...")
-            await conn.execute("CREATE EXTENSION IF NOT EXISTS vector")
-        
-        # Get version
-        version = await conn.fetchval("SELECT version()")
-        print(f"✅ PostgreSQL connected: {version[:50]}...")
+        async with pool.acquire() as conn:
+            # Check pgvector extension
+            result = await conn.fetchval(
+                "SELECT EXISTS(SELECT 1 FROM pg_extension WHERE extname = 'vector')"
+            )
+            
+            if not result:
+                print("📦 Creating pgvector extension...")
+                await conn.execute("CREATE EXTENSION IF NOT EXISTS vector")
+            
+            # Get version
+            version = await conn.fetchval("SELECT version()")
+            print(f"✅ PostgreSQL connected: {version[:50]}...")
         
-        await conn.close()
         return True
         
     except Exception as e:
@@ -53,15 +78,12 @@ async def check_postgres():
 
 async def check_neo4j():
     """Check Neo4j connection."""
-    from src.config import settings
+    from src.neo4j_driver import get_neo4j_driver
     
     print("Checking Neo4j...")
     
     try:
-        driver = AsyncGraphDatabase.driver(
-            settings.neo4j_uri,
-            auth=(settings.neo4j_username, settings.neo4j_password)
-        )
+        driver = await get_neo4j_driver()
         
         async with driver.session() as session:
             result = await session.run("RETURN 1 as n")
@@ -70,7 +92,6 @@ async def check_neo4j():
             if record and record["n"] == 1:
                 print("✅ Neo4j connected")
         
-        await driver.close()
         return True
         
     except Exception as e:
@@ -78,6 +99,20 @@ async def check_neo4j():
         return False
 
 
+@timed
+async def ensure_indexes():
+    """Create the Neo4j entity indexes used by graph lookups."""
+    from src.neo4j_driver import ensure_neo4j_indexes, BASE_ENTITY_INDEXES
+    
+    print("Ensuring Neo4j indexes...")
+    
+    created = await ensure_neo4j_indexes()
+    if created == len(BASE_ENTITY_INDEXES):
+        print("✅ Neo4j indexes ready")
+    else:
+        print(f"⚠️ {len(BASE_ENTITY_INDEXES) - created} Neo4j index(es) could not be created")
+
+
 async def check_ollama():
     """Check Ollama availability."""
     from src.llm_adapter import get_ollama_adapter
@@ -100,6 +135,7 @@ async def check_ollama():
         return False
 
 
+@timed
 async def initialize_rag():
     """Initialize LightRAG storages."""
     from src.rag_config import get_rag_manager
@@ -117,18 +153,33 @@ async def initialize_rag():
         return False
 
 
+@timed
+async def run_probes(probes):
+    """Run the independent connectivity probes concurrently."""
+    return await asyncio.gather(*probes.values(), return_exceptions=True)
+
+
 async def main():
     """Run all initialization checks."""
     print("\n" + "="*50)
     print("LightRAG ATS - Database Initialization")
     print("="*50 + "\n")
     
+    # Probes are independent, so run them concurrently; any exception counts as a failure
+    probes = {
+        "PostgreSQL": check_postgres(),
+        "Neo4j": check_neo4j(),
+        "Ollama": check_ollama(),
+    }
+    outcomes = await run_probes(probes)
     results = {
-        "PostgreSQL": await check_postgres(),
-        "Neo4j": await check_neo4j(),
-        "Ollama": await check_ollama(),
+        name: outcome is True
+        for name, outcome in zip(probes, outcomes)
     }
     
+    if results["Neo4j"]:
+        await ensure_indexes()
+    
     # Only initialize RAG if databases are ready
     if results["PostgreSQL"] and results["Neo4j"]:
         results["LightRAG"] = await initialize_rag()
@@ -148,9 +199,16 @@ async def main():
     all_healthy = all(results.values())
     print("\n" + ("All systems ready!" if all_healthy else "Some components need attention"))
     
+    from src.neo4j_driver import close_neo4j_driver
+    from src.db_pool import close_pg_pool
+    await close_neo4j_driver()
+    await close_pg_pool()
+    
     return all_healthy
 
 
 if __name__ == "__main__":
+    from src.event_loop import install_event_loop_policy
+    install_event_loop_policy()
     success = asyncio.run(main())
     sys.exit(0 if success else 1)
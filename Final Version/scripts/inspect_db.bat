@@ -12,6 +12,8 @@ if not exist "..\%VENV_DIR%" (
     exit /b 1
 )
 
-:: Run the inspection script
-..\%VENV_DIR%\Scripts\python inspect_db.py
+:: Run the inspection script from the project root so settings pick up .env
+pushd ..
+%VENV_DIR%\Scripts\python scripts\inspect_db.py %*
+popd
 pause
@@ -1,25 +1,37 @@
+import argparse
 import asyncio
-import os
-import asyncpg
+import sys
+from pathlib import Path
 from tabulate import tabulate
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
-# Get DB config from env or use defaults (matching docker-compose)
-DB_USER = os.getenv("POSTGRES_USER", "postgres")
-DB_PASSWORD = os.getenv("POSTGRES_PASSWORD", "admin")
-DB_HOST = os.getenv("POSTGRES_HOST", "localhost")
-DB_PORT = os.getenv("POSTGRES_PORT", "5432")
-DB_NAME = os.getenv("POSTGRES_DB", "ats_db")
+from src.config import settings
+from src.db_pool import get_pg_pool, close_pg_pool
+from src.event_loop import install_event_loop_policy
 
-DSN = f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+def _quote_ident(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
 
-async def inspect():
-    print(f"\n🔌 Connecting to {DSN}...")
+
+# Table listing plus planner row estimates in one catalog read. reltuples is
+# O(1) per table, refreshed by autovacuum or an explicit VACUUM (ANALYZE);
+# never-analyzed tables report -1.
+TABLES_QUERY = """
+    SELECT n.nspname AS schemaname, c.relname AS tablename, c.reltuples::bigint AS row_count
+    FROM pg_catalog.pg_class c
+    JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+    WHERE c.relkind IN ('r', 'p')
+      AND n.nspname NOT IN ('pg_catalog', 'information_schema')
+      AND n.nspname NOT LIKE 'pg_toast%'
+    ORDER BY n.nspname, c.relname
+"""
+
+
+async def inspect(exact: bool = False):
+    print(f"\n🔌 Connecting to {settings.postgres_host}:{settings.postgres_port}/{settings.postgres_db}...")
     try:
-        conn = await asyncpg.connect(DSN)
+        pool = await get_pg_pool()
     except Exception as e:
         print(f"❌ Connection failed: {e}")
         print("Ensure 'docker-compose up -d' is running.")
@@ -27,33 +39,40 @@ async def inspect():
 
     print("✅ Connected!\n")
 
+    async with pool.acquire() as conn:
+        await report(conn, pool, exact)
+
+
+async def report(conn, pool, exact: bool = False):
+    """
+    Print tables, row counts and a vector sample using one pooled connection.
+    
+    Row counts come from pg_class.reltuples unless exact is set, in which case
+    every table is scanned with COUNT(*). Run VACUUM (ANALYZE) first if the
+    estimates look stale.
+    """
     # 1. List all tables
     print("📋 TABLES IN DATABASE:")
-    tables = await conn.fetch("""
-        SELECT schemaname, tablename 
-        FROM pg_catalog.pg_tables 
-        WHERE schemaname != 'pg_catalog' AND schemaname != 'information_schema';
-    """)
-    print(tabulate(tables, headers=["Schema", "Table"], tablefmt="simple"))
+    tables = await conn.fetch(TABLES_QUERY)
+    print(tabulate([(t['schemaname'], t['tablename']) for t in tables], headers=["Schema", "Table"], tablefmt="simple"))
     print("-" * 40)
 
     # 2. Check Row Counts & Vector Dimensions
     print("📊 TABLE STATISTICS:")
-    stats = []
     
     # Check for known tables (adjust if your schema differs)
     target_tables = ["lightrag_docs", "lightrag_text_chunks", "lightrag_entities", "lightrag_relationships"]
     
-    for table in tables:
-        t_name = table['tablename']
-        try:
-            count = await conn.fetchval(f"SELECT COUNT(*) FROM {t_name}")
-            stats.append([t_name, count])
-        except Exception:
-            pass
-            
-    print(tabulate(stats, headers=["Table", "Row Count"], tablefmt="grid"))
-    print("-" * 40)
+    table_names = [t['tablename'] for t in tables]
+    if not exact:
+        stats = [
+            [t['tablename'], t['row_count'] if t['row_count'] >= 0 else "n/a (not analyzed)"]
+            for t in tables
+        ]
+        print(tabulate(stats, headers=["Table", "Row Count (estimate)"], tablefmt="grid"))
+        print("-" * 40)
+    else:
+        await print_exact_counts(pool, table_names)
 
     # 3. Sample Vector Data (if chunks exist)
     print("👀 SAMPLE VECTOR DATA (lightrag_text_chunks):")
@@ -78,7 +97,35 @@ async def inspect():
     except Exception as e:
         print(f"Error reading vectors: {e}")
 
-    await conn.close()
+
+async def print_exact_counts(pool, table_names):
+    """Print exact COUNT(*) row counts (full scans; use for audits)."""
+    # Each scan runs on its own pooled connection, so wall time tracks the
+    # slowest table rather than the sum of all of them
+    counts = await asyncio.gather(
+        *(pool.fetchval(f"SELECT COUNT(*) FROM {_quote_ident(t_name)}") for t_name in table_names),
+        return_exceptions=True
+    )
+    # A table that vanished between listing and counting is dropped
+    stats = [
+        [t_name, count] for t_name, count in zip(table_names, counts)
+        if not isinstance(count, Exception)
+    ]
+    
+    print(tabulate(stats, headers=["Table", "Row Count"], tablefmt="grid"))
+    print("-" * 40)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Inspect the ATS PostgreSQL database")
+    parser.add_argument("--exact", action="store_true", help="Use exact COUNT(*) row counts instead of planner estimates")
+    args = parser.parse_args()
+    
+    try:
+        await inspect(exact=args.exact)
+    finally:
+        await close_pg_pool()
 
 if __name__ == "__main__":
-    asyncio.run(inspect())
+    install_event_loop_policy()
+    asyncio.run(main())
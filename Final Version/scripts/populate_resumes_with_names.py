@@ -2,67 +2,83 @@ import csv
 import os
 import shutil
 import re
+import string
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from itertools import islice
 
 # Define paths
 BASE_DIR = r"D:\KT Informatik\ATS project\Final Version"
 CSV_PATH = os.path.join(BASE_DIR, "dataset.csv")
 RESUME_DIR = os.path.join(BASE_DIR, "data", "real_resumes")
 
+# File writes are I/O-bound; overlap them with CSV parsing, keeping at most
+# MAX_PENDING_WRITES resumes buffered in memory
+WRITE_WORKERS = 16
+MAX_PENDING_WRITES = 512
+
+# Compiled once; runs for every CSV row
+# Matches: "Here's a professional resume for John Doe:" or "Here's a sample resume for Jane Smith,"
+# The bounded qualifier keeps a missing "resume for" from scanning the whole line
+_INTRO_RE = re.compile(r"Here's a [^\n]{0,50}? resume for\s+([^,:\.\n]+)", re.IGNORECASE)
+
+class _FilenameTable(dict):
+    """str.translate table: ASCII letters, digits, '_' and '-' pass, anything else becomes '_'."""
+    def __missing__(self, codepoint):
+        return '_'
+
+_FILENAME_TABLE = _FilenameTable((ord(c), c) for c in string.ascii_letters + string.digits + '_-')
+
 def clean_filename(name):
     """Sanitize the filename to avoid invalid characters."""
     # Remove common markdown symbols just in case
-    name = name.replace('*', '').replace('**', '')
-    return re.sub(r'[^a-zA-Z0-9_\-]', '_', name.strip())
+    name = name.replace('*', '')
+    return name.strip().translate(_FILENAME_TABLE)
+
+def write_resume(file_path, content):
+    with open(file_path, 'w', encoding='utf-8') as f:
+        f.write(content)
 
 def extract_name_from_resume(text):
     """
     Attempts to extract the candidate name from the resume text.
     Many entries start with "Here's a professional resume for [Name]:"
     """
-    # Pattern 1: Intro sentence
-    # Matches: "Here's a professional resume for John Doe:" or "Here's a sample resume for Jane Smith,"
-    match = re.search(r"Here's a .*? resume for\s+([^,:\.\n]+)", text, re.IGNORECASE)
+    # Pattern 1: Intro sentence (see _INTRO_RE)
+    match = _INTRO_RE.search(text)
     if match:
         raw_name = match.group(1).strip()
         # Sometimes the regex might catch too much if the pattern isn't exact, 
-        # but the non-greedy .*? and exclusion class [^,:\.\n] helps.
+        # but the bounded qualifier and exclusion class [^,:\.\n] help.
         return raw_name
     
     # Pattern 2: Look at the first few non-empty lines. 
     # Usually the name is the first line or right after the intro.
-    lines = [line.strip() for line in text.split('\n') if line.strip()]
+    # Lazily strip lines (once each) and stop after the first 5 non-empty ones
+    stripped = (line.strip() for line in text.split('\n'))
+    lines = islice((line for line in stripped if line), 5)
     
     # Skip the "Here's a..." line/sentence if it didn't match the regex for some reason 
     # (or if we want to look past it for the *title* header which might be the name)
-    for line in lines[:5]:  # Check first 5 lines
+    for line in lines:  # Check first 5 lines
         if "Here's a" in line or "Here is a " in line:
             continue
         # If the line looks like a name (mostly letters, not too long), use it
         # Heuristic: < 50 chars, doesn't contain "Resume" or "Summary"
-        if len(line) < 50 and "resume" not in line.lower() and "professional summary" not in line.lower():
-            # Ensure it has some letters
+        if len(line) >= 50:
+            continue
+        low = line.lower()
+        if "resume" not in low and "professional summary" not in low:
+            # Ensure it has some letters (any() stops at the first one)
             if any(c.isalpha() for c in line):
                 return line
                 
     return "Candidate"
 
 def main():
-    # 1. Clear the target directory
-    if os.path.exists(RESUME_DIR):
-        print(f"Cleaning directory: {RESUME_DIR}")
-        # Delete all files and subdirs
-        for item in os.listdir(RESUME_DIR):
-            item_path = os.path.join(RESUME_DIR, item)
-            try:
-                if os.path.isfile(item_path) or os.path.islink(item_path):
-                    os.unlink(item_path)
-                elif os.path.isdir(item_path):
-                    shutil.rmtree(item_path)
-            except Exception as e:
-                print(f"Failed to delete {item_path}. Reason: {e}")
-    else:
-        print(f"Directory {RESUME_DIR} does not exist. Creating it.")
-        os.makedirs(RESUME_DIR)
+    # 1. Clear the target directory (one recursive removal, then recreate)
+    print(f"Cleaning directory: {RESUME_DIR}")
+    shutil.rmtree(RESUME_DIR, ignore_errors=True)
+    os.makedirs(RESUME_DIR, exist_ok=True)
 
     # 2. Read CSV and generate files
     print(f"Reading from {CSV_PATH}...")
@@ -75,12 +91,23 @@ def main():
     total_files = 0
     
     try:
-        with open(CSV_PATH, mode='r', encoding='utf-8', newline='') as csvfile:
-            reader = csv.DictReader(csvfile)
+        with open(CSV_PATH, mode='r', encoding='utf-8', newline='') as csvfile, \
+                ThreadPoolExecutor(max_workers=WRITE_WORKERS) as executor:
+            # Plain rows plus header positions avoid building a dict per row
+            reader = csv.reader(csvfile)
+            header = next(reader, [])
+            role_col = header.index('Role') if 'Role' in header else None
+            resume_col = header.index('Resume') if 'Resume' in header else None
+            # Rows must reach the last column we read; this also skips blank
+            # lines, which csv.reader yields as [] (DictReader dropped them)
+            min_len = max((c + 1 for c in (role_col, resume_col) if c is not None), default=1)
+            pending = set()
             
             for row in reader:
-                role = row.get('Role', 'Uncategorized').strip()
-                resume_content = row.get('Resume', '').strip()
+                if len(row) < min_len:
+                    continue
+                role = row[role_col].strip() if role_col is not None else 'Uncategorized'
+                resume_content = row[resume_col].strip() if resume_col is not None else ''
                 
                 if not resume_content:
                     continue
@@ -105,13 +132,19 @@ def main():
                 filename = f"{safe_role}_{safe_name}_{count_by_role[role]}.txt"
                 file_path = os.path.join(RESUME_DIR, filename)
                 
-                # Write content to file
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(resume_content)
+                # Write content to file in the background
+                pending.add(executor.submit(write_resume, file_path, resume_content))
+                if len(pending) >= MAX_PENDING_WRITES:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        future.result()  # Surface write errors
                 
                 total_files += 1
                 if total_files % 1000 == 0:
                     print(f"Generated {total_files} resumes...")
+            
+            for future in pending:
+                future.result()
                     
         print(f"Successfully generated {total_files} resume files with names in {RESUME_DIR}.")
         
@@ -6,20 +6,15 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.config import settings
-import asyncpg
+from src.db_pool import get_pg_pool, close_pg_pool
+from src.event_loop import install_event_loop_policy
 from neo4j import GraphDatabase
 import os
 
 async def reset_postgres():
     print("🧹 Cleaning PostgreSQL...")
     try:
-        conn = await asyncpg.connect(
-            host=settings.postgres_host,
-            port=settings.postgres_port,
-            user=settings.postgres_user,
-            password=settings.postgres_password,
-            database=settings.postgres_db
-        )
+        pool = await get_pg_pool()
         
         # List of tables to truncate
         # Note: We preserve lightrag_llm_cache to speed up re-ingestion if prompts are identical
@@ -30,25 +25,36 @@ async def reset_postgres():
             "lightrag_vdb_chunks",
         ]
         
-        for table in tables:
-            try:
-                # Check if table exists first to avoid error spam
-                exists = await conn.fetchval(
-                    "SELECT EXISTS (SELECT FROM information_schema.tables WHERE table_name = $1)",
-                    table
-                )
-                if exists:
-                    await conn.execute(f"TRUNCATE TABLE {table} CASCADE")
-                    print(f"   - Truncated {table}")
-                else:
+        async with pool.acquire() as conn:
+            # One round-trip to find which tables exist (to_regclass is NULL otherwise)
+            rows = await conn.fetch(
+                "SELECT t FROM unnest($1::text[]) AS t WHERE to_regclass(t) IS NOT NULL",
+                tables
+            )
+            existing = [r["t"] for r in rows]
+            
+            for table in tables:
+                if table not in existing:
                     print(f"   - Skipped {table} (not found)")
-            except Exception as e:
-                print(f"   - Error truncating {table}: {e}")
-                
-        await conn.close()
+            
+            if existing:
+                try:
+                    # PostgreSQL truncates a comma-separated list in a single statement
+                    await conn.execute(f"TRUNCATE TABLE {', '.join(existing)} CASCADE")
+                    for table in existing:
+                        print(f"   - Truncated {table}")
+                except Exception as e:
+                    print(f"   - Error truncating {', '.join(existing)}: {e}")
     except Exception as e:
         print(f"❌ Postgres connection failed: {e}")
 
+NEO4J_DELETE_BATCH_SIZE = 10000
+
+NEO4J_BATCHED_DELETE = """
+MATCH (n)
+CALL { WITH n DETACH DELETE n } IN TRANSACTIONS OF $batch_size ROWS
+"""
+
 def reset_neo4j():
     print("🧹 Cleaning Neo4j...")
     
@@ -60,18 +66,20 @@ def reset_neo4j():
         # Use the specific database we configured
         db_name = os.getenv("NEO4J_DATABASE", "neo4j")
         with driver.session(database=db_name) as session:
-            session.run("MATCH (n) DETACH DELETE n")
-            print("   - All nodes and relationships deleted")
+            # Delete in bounded transactions instead of one store-wide transaction
+            # (needs an auto-commit session, which session.run provides)
+            summary = session.run(NEO4J_BATCHED_DELETE, batch_size=NEO4J_DELETE_BATCH_SIZE).consume()
+            print(f"   - All nodes and relationships deleted ({summary.counters.nodes_deleted} nodes)")
         driver.close()
     except Exception as e:
         print(f"❌ Neo4j connection failed: {e}")
 
 async def main():
     await reset_postgres()
+    await close_pg_pool()
     reset_neo4j()
     print("✨ Reset complete!")
 
 if __name__ == "__main__":
-    if os.name == 'nt':
-        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    install_event_loop_policy()
     asyncio.run(main())
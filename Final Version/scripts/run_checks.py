@@ -0,0 +1,55 @@
+"""
+Run the database health checks and reports in one process.
+
+Chaining init_db / inspect_db / check_neo4j_count as separate commands pays
+interpreter start-up, driver imports and connection setup once per script.
+Here they share one event loop, one asyncpg pool and one Neo4j driver.
+
+Usage:
+    python scripts/run_checks.py [--exact]
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.init_db import check_postgres, check_neo4j, check_ollama
+from scripts.inspect_db import inspect
+from scripts.check_neo4j_count import check_graph
+from src.db_pool import close_pg_pool
+from src.neo4j_driver import close_neo4j_driver
+from src.event_loop import install_event_loop_policy
+
+
+async def main(exact: bool = False) -> bool:
+    # Connectivity probes are independent; reports print a lot, so run them in turn
+    outcomes = await asyncio.gather(
+        check_postgres(), check_neo4j(), check_ollama(),
+        return_exceptions=True
+    )
+    postgres_ok, neo4j_ok, _ = (outcome is True for outcome in outcomes)
+    
+    try:
+        if postgres_ok:
+            await inspect(exact=exact)
+        if neo4j_ok:
+            await check_graph()
+    finally:
+        await close_neo4j_driver()
+        await close_pg_pool()
+    
+    return all(outcome is True for outcome in outcomes)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run all ATS database checks in one process")
+    parser.add_argument("--exact", action="store_true", help="Use exact COUNT(*) row counts")
+    args = parser.parse_args()
+    
+    install_event_loop_policy()
+    success = asyncio.run(main(exact=args.exact))
+    sys.exit(0 if success else 1)
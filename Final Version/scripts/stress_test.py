@@ -1,16 +1,27 @@
 """
 ATS STRESS TEST - Principal AI Evaluation Engineer
 Tests system with 5 diverse JDs and 5 complex queries.
+
+The JD analyses for each query are sent concurrently; start Ollama with
+OLLAMA_NUM_PARALLEL>1 (and OLLAMA_MAX_LOADED_MODELS=1) so it actually serves
+generations in parallel.
 """
 
 import asyncio
 import httpx
 import json
+import sys
 from datetime import datetime
+from pathlib import Path
 from typing import Dict, List, Any
 
 BASE_URL = "http://127.0.0.1:8000"
 
+# Concurrent probes share keep-alive connections; fail fast if the server is down.
+# (HTTP/2 is not enabled: uvicorn serves plain-text HTTP/1.1 only.)
+CLIENT_TIMEOUT = httpx.Timeout(180.0, connect=10.0)
+CLIENT_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=20)
+
 # ============================================================
 # 5 DISTINCT JOB DESCRIPTIONS
 # ============================================================
@@ -134,7 +145,7 @@ async def run_stress_test():
         "query_results": []
     }
     
-    async with httpx.AsyncClient(timeout=180.0) as client:
+    async with httpx.AsyncClient(timeout=CLIENT_TIMEOUT, limits=CLIENT_LIMITS) as client:
         
         # Test each query
         for query_spec in COMPLEX_QUERIES:
@@ -150,11 +161,11 @@ async def run_stress_test():
             
             actual_matches = []
             
-            # Run against each JD
-            for jd_id, jd_spec in JOB_DESCRIPTIONS.items():
-                try:
-                    # Analyze using the JD
-                    resp = await client.post(
+            # Fire the analyses for every JD at once; the server overlaps
+            # retrieval for one request with LLM generation for another
+            responses = await asyncio.gather(
+                *(
+                    client.post(
                         f"{BASE_URL}/analyze",
                         json={
                             "job_id": f"stress-{jd_id}-{query_id}",
@@ -162,6 +173,16 @@ async def run_stress_test():
                             "top_k": 5
                         }
                     )
+                    for jd_id, jd_spec in JOB_DESCRIPTIONS.items()
+                ),
+                return_exceptions=True
+            )
+            
+            # Run against each JD
+            for jd_id, resp in zip(JOB_DESCRIPTIONS, responses):
+                try:
+                    if isinstance(resp, Exception):
+                        raise resp
                     
                     if resp.status_code == 200:
                         data = resp.json()
@@ -238,4 +259,7 @@ async def run_stress_test():
     return results
 
 if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    from src.event_loop import install_event_loop_policy
+    install_event_loop_policy()
     asyncio.run(run_stress_test())
@@ -19,11 +19,11 @@ async def test_mode(rag, mode: str, query: str):
     print(f"\n🔍 Testing mode: {mode}")
     print("-" * 40)
     
-    start = time.time()
+    start = time.perf_counter()
     
     try:
         response = await rag.aquery(query, param=QueryParam(mode=mode))
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
         
         if response:
             preview = response[:200] + "..." if len(response) > 200 else response
@@ -35,7 +35,7 @@ async def test_mode(rag, mode: str, query: str):
             return False, elapsed
             
     except Exception as e:
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
         print(f"❌ Failed ({elapsed:.2f}s): {e}")
         return False, elapsed
 
@@ -47,12 +47,12 @@ async def test_dual_retrieval(rag, query: str):
     print("\n🔍 Testing Dual-Level Retrieval with Fallback")
     print("-" * 40)
     
-    start = time.time()
+    start = time.perf_counter()
     
     try:
         retrieval = DualLevelRetrieval(rag)
         result = await retrieval.query_with_fallback(query, preferred_mode="mix")
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
         
         preview = result.response[:200] + "..." if len(result.response) > 200 else result.response
         
@@ -64,7 +64,7 @@ async def test_dual_retrieval(rag, query: str):
         return True, elapsed
         
     except Exception as e:
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
         print(f"❌ Failed ({elapsed:.2f}s): {e}")
         return False, elapsed
 
@@ -129,5 +129,7 @@ async def main():
 
 
 if __name__ == "__main__":
+    from src.event_loop import install_event_loop_policy
+    install_event_loop_policy()
     success = asyncio.run(main())
     sys.exit(0 if success else 1)
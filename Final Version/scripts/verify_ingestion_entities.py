@@ -9,12 +9,15 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from src.ingestion import ingest_resume
 from src.rag_config import get_rag_manager, get_query_param
 from src.config import settings
+from src.event_loop import install_event_loop_policy
 
 async def verify_ingestion():
     resume_path = os.path.abspath("data/real_resumes/AI_Engineer_1.txt")
     print(f"--- 1. Ingesting {resume_path} ---")
     
     try:
+        # Initialize once; ingestion and the verification query share this instance
+        rag = await get_rag_manager().initialize()
         result = await ingest_resume(resume_path)
         if result.success:
             print(f"[SUCCESS] Ingestion Successful for {result.candidate_name}")
@@ -30,9 +33,6 @@ async def verify_ingestion():
     # LightRAG doesn't expose a direct "get_entities" easily, but we can query the graph storage if accessible.
     
     try:
-        rag_manager = get_rag_manager()
-        rag = await rag_manager.initialize()
-        
         # Using a global query mode might retrieve relevant entities if we search for the candidate name or skills
         query = "List all skills and roles found in the resume"
         print(f"Querying RAG: '{query}'")
@@ -45,6 +45,5 @@ async def verify_ingestion():
         print(f"[FAILED] Verification failed: {e}")
 
 if __name__ == "__main__":
-    if sys.platform == "win32":
-        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    install_event_loop_policy()
     asyncio.run(verify_ingestion())
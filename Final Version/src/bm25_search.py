@@ -12,6 +12,37 @@ from rank_bm25 import BM25Okapi
 
 logger = logging.getLogger(__name__)
 
+# Tokenizer tables, compiled once at import instead of on every _tokenize call
+_SKILL_NORMALIZATIONS = [
+    (r'\breact\.?js\b', 'reactjs'),
+    (r'\bnode\.?js\b', 'nodejs'),
+    (r'\bvue\.?js\b', 'vuejs'),
+    (r'\btype\s*script\b', 'typescript'),
+    (r'\bjava\s*script\b', 'javascript'),
+    (r'\bc\+\+\b', 'cplusplus'),
+    (r'\bc#\b', 'csharp'),
+    (r'\b\.net\b', 'dotnet'),
+]
+
+# All normalizations as one alternation (one group per rule) so the text is
+# scanned once; the matched group's index selects the replacement.
+_SKILL_NORMALIZATION_PATTERN = re.compile(
+    '|'.join(f'({pattern})' for pattern, _ in _SKILL_NORMALIZATIONS)
+)
+_SKILL_REPLACEMENTS = [replacement for _, replacement in _SKILL_NORMALIZATIONS]
+
+
+def _normalize_skill(match: re.Match) -> str:
+    return _SKILL_REPLACEMENTS[match.lastindex - 1]
+
+_TOKEN_PATTERN = re.compile(r'\b[a-z0-9+#]+\b')
+
+_STOPWORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by',
+    'is', 'are', 'was', 'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does', 'did',
+    'will', 'would', 'could', 'should', 'may', 'might', 'can',
+})
+
 
 @dataclass
 class BM25SearchResult:
@@ -41,29 +72,13 @@ class BM25Index:
         text = text.lower()
         
         # Normalize common skill variations
-        skill_normalizations = {
-            r'\breact\.?js\b': 'reactjs',
-            r'\bnode\.?js\b': 'nodejs',
-            r'\bvue\.?js\b': 'vuejs',
-            r'\btype\s*script\b': 'typescript',
-            r'\bjava\s*script\b': 'javascript',
-            r'\bc\+\+\b': 'cplusplus',
-            r'\bc#\b': 'csharp',
-            r'\b\.net\b': 'dotnet',
-            r'\baws\b': 'aws',
-            r'\bgcp\b': 'gcp',
-            r'\bazure\b': 'azure',
-        }
-        
-        for pattern, replacement in skill_normalizations.items():
-            text = re.sub(pattern, replacement, text)
+        text = _SKILL_NORMALIZATION_PATTERN.sub(_normalize_skill, text)
         
         # Split into tokens (alphanumeric + some special chars)
-        tokens = re.findall(r'\b[a-z0-9+#]+\b', text)
+        tokens = _TOKEN_PATTERN.findall(text)
         
         # Remove very short tokens and common stopwords
-        stopwords = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might', 'can'}
-        tokens = [t for t in tokens if len(t) > 1 and t not in stopwords]
+        tokens = [t for t in tokens if len(t) > 1 and t not in _STOPWORDS]
         
         return tokens
     
@@ -77,7 +92,7 @@ class BM25Index:
         self._documents = documents
         self._tokenized_docs = [self._tokenize(doc) for doc in documents]
         self._index = BM25Okapi(self._tokenized_docs)
-        logger.info(f"Built BM25 index with {len(documents)} documents")
+        logger.info("Built BM25 index with %d documents", len(documents))
     
     def search(
         self,
@@ -124,7 +139,8 @@ class BM25Index:
         # Limit to top_k
         results = results[:top_k]
         
-        logger.debug(f"BM25 search: query='{query[:50]}...', results={len(results)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("BM25 search: query='%s...', results=%d", query[:50], len(results))
         return results
     
     def get_document_count(self) -> int:
@@ -144,6 +160,21 @@ def get_bm25_index() -> BM25Index:
     return _bm25_index
 
 
+def _rank_positions(scores: List[float]) -> Dict[int, int]:
+    """Map document index -> 1-based rank by descending score (positive scores only)."""
+    order = sorted(
+        (i for i, score in enumerate(scores) if score > 0),
+        key=lambda i: scores[i],
+        reverse=True
+    )
+    return {i: rank for rank, i in enumerate(order, start=1)}
+
+
+def _rrf_term(weight: float, rank: Optional[int], k: int) -> float:
+    """Weighted Reciprocal Rank Fusion contribution for one ranking."""
+    return weight / (k + rank) if rank is not None else 0.0
+
+
 async def hybrid_search(
     query: str,
     documents: List[str],
@@ -152,7 +183,9 @@ async def hybrid_search(
     bm25_weight: float = 0.3,
     vector_weight: float = 0.5,
     graph_weight: float = 0.2,
-    graph_bonus: Optional[List[float]] = None
+    graph_bonus: Optional[List[float]] = None,
+    fusion: str = "weighted",
+    rrf_k: int = 60
 ) -> List[Dict]:
     """
     Perform hybrid search combining BM25 + Vector + Graph scores.
@@ -166,6 +199,10 @@ async def hybrid_search(
         vector_weight: Weight for vector scores (default 0.5)
         graph_weight: Weight for graph bonus (default 0.2)
         graph_bonus: Optional graph-based bonus scores
+        fusion: 'weighted' (normalized score blend) or 'rrf' (Reciprocal Rank
+            Fusion: sum of weight / (rrf_k + rank) per signal; insensitive to
+            score scales, the weights above apply per ranking)
+        rrf_k: RRF rank offset (60 is the standard choice)
         
     Returns:
         List of dicts with 'content', 'score', 'index', 'score_breakdown'
@@ -196,6 +233,14 @@ async def hybrid_search(
     if graph_bonus is None:
         graph_bonus = [0.0] * len(documents)
     
+    if fusion == "rrf":
+        # 1-based ranks per signal; documents a signal didn't score get no contribution
+        bm25_ranks = {r.index: rank for rank, r in enumerate(bm25_results, start=1)}
+        vector_ranks = _rank_positions(vector_scores)
+        graph_ranks = _rank_positions(graph_bonus)
+    elif fusion != "weighted":
+        raise ValueError(f"Unknown fusion method: {fusion}")
+    
     # Calculate hybrid scores
     results = []
     for i, doc in enumerate(documents):
@@ -203,11 +248,18 @@ async def hybrid_search(
         vec_score = normalized_vector[i] if i < len(normalized_vector) else 0.0
         g_bonus = graph_bonus[i] if i < len(graph_bonus) else 0.0
         
-        hybrid_score = (
-            bm25_weight * bm25_score +
-            vector_weight * vec_score +
-            graph_weight * g_bonus
-        )
+        if fusion == "rrf":
+            hybrid_score = (
+                _rrf_term(bm25_weight, bm25_ranks.get(i), rrf_k) +
+                _rrf_term(vector_weight, vector_ranks.get(i), rrf_k) +
+                _rrf_term(graph_weight, graph_ranks.get(i), rrf_k)
+            )
+        else:
+            hybrid_score = (
+                bm25_weight * bm25_score +
+                vector_weight * vec_score +
+                graph_weight * g_bonus
+            )
         
         results.append({
             'content': doc,
@@ -226,6 +278,9 @@ async def hybrid_search(
     # Limit to top_k
     results = results[:top_k]
     
-    logger.info(f"Hybrid search: {len(results)} results (weights: BM25={bm25_weight}, Vec={vector_weight}, Graph={graph_weight})")
+    logger.info(
+        "Hybrid search (%s): %d results (weights: BM25=%s, Vec=%s, Graph=%s)",
+        fusion, len(results), bm25_weight, vector_weight, graph_weight
+    )
     
     return results
@@ -1,9 +1,31 @@
-import torch 
+import shutil
+import subprocess
 
-if torch.cuda.is_available():
-    print(f"✅ Success! CUDA is enabled.")
-    print(f"   GPU: {torch.cuda.get_device_name(0)}")
-    print(f"   VRAM: {torch.cuda.get_device_properties(0).total_memory / 1024**3:.2f} GB")
-    print(f"   CUDA Version: {torch.version.cuda}")
+
+def list_nvidia_gpus():
+    """List GPUs via nvidia-smi without loading torch (empty if no driver/GPU)."""
+    if shutil.which("nvidia-smi") is None:
+        return []
+    try:
+        result = subprocess.run(["nvidia-smi", "-L"], capture_output=True, text=True, timeout=2)
+    except (OSError, subprocess.TimeoutExpired):
+        return []
+    return [line for line in result.stdout.splitlines() if line.startswith("GPU")]
+
+
+gpus = list_nvidia_gpus()
+
+if not gpus:
+    # No driver-visible GPU: torch cannot have CUDA either, so skip importing it
+    print("❌ Error: CUDA not detected. Check your install.")
 else:
-    print("❌ Error: CUDA not detected. Check your install.")
\ No newline at end of file
+    import torch
+
+    if torch.cuda.is_available():
+        print(f"✅ Success! CUDA is enabled.")
+        print(f"   GPU: {torch.cuda.get_device_name(0)}")
+        print(f"   VRAM: {torch.cuda.get_device_properties(0).total_memory / 1024**3:.2f} GB")
+        print(f"   CUDA Version: {torch.version.cuda}")
+    else:
+        print("❌ Error: CUDA not detected. Check your install.")
+        print(f"   nvidia-smi sees {len(gpus)} GPU(s), but this torch build has no CUDA support.")
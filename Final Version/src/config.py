@@ -5,6 +5,7 @@ Uses Pydantic Settings for environment variable loading and validation.
 
 import os
 from functools import lru_cache
+from urllib.parse import quote
 from pydantic_settings import BaseSettings
 from pydantic import Field
 
@@ -22,11 +23,16 @@ class Settings(BaseSettings):
     postgres_user: str = Field(default="postgres")
     postgres_password: str = Field(default="admin")
     postgres_db: str = Field(default="ats_db")
+    postgres_pool_min_size: int = Field(default=2)
+    postgres_pool_max_size: int = Field(default=10)
     
     # Neo4j Configuration (use bolt:// for standalone, neo4j:// for cluster)
     neo4j_uri: str = Field(default="bolt://127.0.0.1:7687")
     neo4j_username: str = Field(default="neo4j")
     neo4j_password: str = Field(default="password")
+    neo4j_max_pool_size: int = Field(default=50, description="Max connections in the Neo4j driver pool")
+    neo4j_acquisition_timeout: float = Field(default=30.0, description="Seconds to wait for a pooled connection")
+    neo4j_max_connection_lifetime: int = Field(default=3600, description="Seconds before a pooled connection is recycled")
     
     # Ollama / LLM Configuration
     ollama_base_url: str = Field(default="http://localhost:11434")
@@ -47,11 +53,17 @@ class Settings(BaseSettings):
     
     # Reranking Configuration
     rerank_model: str = Field(default="cross-encoder/ms-marco-MiniLM-L-6-v2")
+    rerank_precision: str = Field(default="fp32", description="Reranker weight precision: 'fp32', 'bf16' or 'fp16' (fp16 needs CUDA)")
+    rerank_batch_size: int = Field(default=32, description="Pairs per cross-encoder forward pass")
+    rerank_batch_max_requests: int = Field(default=8, description="Max concurrent rerank calls coalesced into one forward pass")
+    rerank_batch_wait_ms: float = Field(default=5.0, description="How long to wait for more rerank calls before scoring")
     
     # LightRAG Configuration
     rag_working_dir: str = Field(default="./rag_storage")
     chunk_token_size: int = Field(default=500)
     chunk_overlap_size: int = Field(default=50)
+    context_cache_size: int = Field(default=256, description="Max cached raw-context retrievals for chat")
+    context_cache_ttl: float = Field(default=300.0, description="Seconds a cached raw-context retrieval stays valid")
     
     # API Configuration
     api_host: str = Field(default="0.0.0.0")
@@ -61,6 +73,14 @@ class Settings(BaseSettings):
     # Logging
     log_level: str = Field(default="INFO")
     
+    @property
+    def postgres_dsn(self) -> str:
+        """PostgreSQL connection string built from the postgres_* fields."""
+        return (
+            f"postgresql://{quote(self.postgres_user, safe='')}:{quote(self.postgres_password, safe='')}"
+            f"@{self.postgres_host}:{self.postgres_port}/{self.postgres_db}"
+        )
+    
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
@@ -0,0 +1,59 @@
+"""
+Shared PostgreSQL connection pool.
+Scripts and services acquire connections from one lazily created asyncpg pool
+instead of paying a fresh connect/auth handshake per check.
+"""
+
+import asyncio
+import logging
+from typing import Optional
+
+import asyncpg
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+_pool: Optional[asyncpg.Pool] = None
+_pool_lock = asyncio.Lock()
+
+
+async def get_pg_pool(dsn: Optional[str] = None) -> asyncpg.Pool:
+    """
+    Get or lazily create the process-wide asyncpg pool.
+    
+    Args:
+        dsn: Optional connection string; defaults to settings.postgres_dsn
+        
+    Returns:
+        Shared asyncpg pool
+    """
+    global _pool
+    
+    if _pool is not None:
+        return _pool
+    
+    async with _pool_lock:
+        if _pool is None:
+            logger.info("Creating PostgreSQL connection pool")
+            _pool = await asyncpg.create_pool(
+                dsn or settings.postgres_dsn,
+                min_size=settings.postgres_pool_min_size,
+                max_size=settings.postgres_pool_max_size,
+                max_inactive_connection_lifetime=300,
+                command_timeout=60,
+                # Short catalog/COUNT queries never amortize JIT compilation
+                server_settings={"jit": "off"},
+            )
+    
+    return _pool
+
+
+async def close_pg_pool():
+    """Close the shared pool (call once on shutdown)."""
+    global _pool
+    
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
+        logger.info("PostgreSQL pool closed")
@@ -4,6 +4,9 @@ Implements fallback mechanisms for robust retrieval.
 """
 
 import logging
+import re
+import time
+from collections import OrderedDict
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 
@@ -14,6 +17,39 @@ from .prompts import CHAT_RESPONSE_PROMPT
 
 logger = logging.getLogger(__name__)
 
+# Raw-context retrievals, keyed by query: repeated or follow-up chat questions
+# skip the vector search. LRU-bounded, entries expire after TTL, and ingestion
+# clears the cache so new resumes show up immediately.
+_context_cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+
+def _get_cached_context(query: str) -> Optional[str]:
+    entry = _context_cache.get(query)
+    if entry is None:
+        return None
+    cached_at, context = entry
+    if time.monotonic() - cached_at >= settings.context_cache_ttl:
+        del _context_cache[query]
+        return None
+    _context_cache.move_to_end(query)
+    return context
+
+
+def _cache_context(query: str, context: str) -> None:
+    _context_cache[query] = (time.monotonic(), context)
+    _context_cache.move_to_end(query)
+    while len(_context_cache) > settings.context_cache_size:
+        _context_cache.popitem(last=False)
+
+
+def clear_context_cache() -> None:
+    """Drop all cached raw-context retrievals (call after the index changes)."""
+    _context_cache.clear()
+
+
+# Capitalized 2-3 word names, used to check responses against retrieved context
+_NAME_PATTERN = re.compile(r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,2})\b')
+
 
 @dataclass
 class RetrievalResult:
@@ -68,10 +104,10 @@ class DualLevelRetrieval:
                 param=QueryParam(mode=mode)
             )
             if response:
-                logger.info(f"✅ Query succeeded with mode: {mode}")
+                logger.info("✅ Query succeeded with mode: %s", mode)
                 return response, mode
             else:
-                logger.warning(f"Mode '{mode}' returned empty response")
+                logger.warning("Mode '%s' returned empty response", mode)
                 return None, mode
                 
         except Exception as e:
@@ -252,15 +288,21 @@ async def chat_with_dual_retrieval(
     
     # Step 1: Get raw context using only_need_context parameter
     # This bypasses LightRAG's internal LLM call and returns raw chunks
-    try:
-        raw_context = await rag.aquery(
-            query,
-            param=QueryParam(mode="naive", only_need_context=True)
-        )
-        logger.info(f"📄 Retrieved {len(raw_context) if raw_context else 0} chars of raw context")
-    except Exception as e:
-        logger.warning(f"Raw context retrieval failed: {e}, falling back to standard mode")
-        raw_context = None
+    raw_context = _get_cached_context(query)
+    if raw_context:
+        logger.info("📄 Reusing %d chars of cached raw context", len(raw_context))
+    else:
+        try:
+            raw_context = await rag.aquery(
+                query,
+                param=QueryParam(mode="naive", only_need_context=True)
+            )
+            logger.info("📄 Retrieved %d chars of raw context", len(raw_context) if raw_context else 0)
+            if raw_context:
+                _cache_context(query, raw_context)
+        except Exception as e:
+            logger.warning(f"Raw context retrieval failed: {e}, falling back to standard mode")
+            raw_context = None
     
     # Step 2: If raw context retrieval worked, use grounded LLM call
     if raw_context:
@@ -319,7 +361,8 @@ def validate_grounded_response(response: str, context: str) -> Dict[str, Any]:
     Returns:
         Dict with 'valid' boolean and 'reason' string
     """
-    import re
+    # Lowercased once and reused by every case-insensitive check below
+    response_lower = response.lower() if response else ""
     
     # Check 1: Response is not empty or too short
     if not response or len(response.strip()) < 10:
@@ -332,11 +375,9 @@ def validate_grounded_response(response: str, context: str) -> Dict[str, Any]:
     
     # Check 3: Extract potential names from context and check if any appear in response
     # Look for capitalized names (2-3 words) to avoid common words
-    name_pattern = r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,2})\b'
-    
     # helper to normalize names for comparison
     def normalize_names(text):
-        matches = re.findall(name_pattern, text)
+        matches = _NAME_PATTERN.findall(text)
         return {m.lower() for m in matches}
 
     context_names = normalize_names(context)
@@ -347,22 +388,18 @@ def validate_grounded_response(response: str, context: str) -> Dict[str, Any]:
         # Check intersection (exact match ignoring case)
         exact_matches = context_names & response_names
         
-        # Check partial match (e.g. "Tammy" in "Tammy McKenzie")
+        # Check partial match (e.g. "Tammy" in "Tammy McKenzie"): some response
+        # name shares a part with some context name, i.e. the union of all
+        # response name parts overlaps the union of all context name parts
         partial_matches = False
         if not exact_matches:
-            for r_name in response_names:
-                for c_name in context_names:
-                    # If response name parts are subset of context name parts
-                    r_parts = set(r_name.split())
-                    c_parts = set(c_name.split())
-                    if r_parts & c_parts: # Overlap found
-                        partial_matches = True
-                        break
-                if partial_matches: break
+            response_parts = {part for name in response_names for part in name.split()}
+            context_parts = {part for name in context_names for part in name.split()}
+            partial_matches = not response_parts.isdisjoint(context_parts)
 
         if not exact_matches and not partial_matches:
             # Check if it's a "no candidate found" type response
-            if "no candidate" not in response.lower() and "not find" not in response.lower() and "cannot provide" not in response.lower():
+            if "no candidate" not in response_lower and "not find" not in response_lower and "cannot provide" not in response_lower:
                  return {"valid": False, "reason": "Response contains names not found in resume data"}
     
     # Check 4: Response shouldn't contain self-referential statements
@@ -374,7 +411,6 @@ def validate_grounded_response(response: str, context: str) -> Dict[str, Any]:
         "my knowledge",
         "my training"
     ]
-    response_lower = response.lower()
     for marker in hallucination_markers:
         if marker in response_lower:
             return {"valid": False, "reason": "Response contains self-referential AI statements"}
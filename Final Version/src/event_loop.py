@@ -0,0 +1,27 @@
+"""
+Event loop setup for script and server entrypoints.
+Uses uvloop when it is installed, and the selector loop on Windows
+(the default proactor loop breaks asyncpg / neo4j there).
+"""
+
+import asyncio
+import logging
+import sys
+
+logger = logging.getLogger(__name__)
+
+# Optional dependency - falls back to the stdlib loop when missing
+try:
+    import uvloop
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
+
+def install_event_loop_policy():
+    """Set the fastest available event loop policy. Call before asyncio.run()."""
+    if sys.platform == "win32":
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    elif HAS_UVLOOP:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        logger.debug("uvloop event loop policy installed")
@@ -5,15 +5,16 @@ Resume ingestion pipeline with batch processing and progress tracking.
 import os
 import logging
 import asyncio
+import time
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from dataclasses import dataclass, field
-from datetime import datetime
 
 from tqdm import tqdm
 
 from .resume_parser import parse_resume, get_resume_files, extract_candidate_name
 from .rag_config import get_rag
+from .dual_retrieval import clear_context_cache
 
 logger = logging.getLogger(__name__)
 
@@ -77,11 +78,11 @@ class ResumeIngestion:
         Returns:
             IngestionResult with status
         """
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         try:
-            # Parse resume
-            content, file_type = parse_resume(file_path)
+            # Parse resume (PDF/DOCX extraction is blocking; keep it off the event loop)
+            content, file_type = await asyncio.to_thread(parse_resume, file_path)
             
             if not content.strip():
                 return IngestionResult(
@@ -104,12 +105,14 @@ class ResumeIngestion:
             if rag is None:
                 raise RuntimeError("RAG instance is None")
             
-            logger.debug(f"Ingesting document for {candidate_name} (length: {len(doc_content)} chars)")
+            logger.debug("Ingesting document for %s (length: %d chars)", candidate_name, len(doc_content))
             
             # Ingest into LightRAG (just pass the text content)
             try:
                 await rag.ainsert(doc_content)
-                logger.debug(f"Successfully called ainsert for {candidate_name}")
+                logger.debug("Successfully called ainsert for %s", candidate_name)
+                # Cached chat context predates this resume
+                clear_context_cache()
             except KeyError as e:
                 if 'history_messages' in str(e):
                     logger.error("LightRAG history_messages KeyError - pipeline status not initialized")
@@ -122,9 +125,9 @@ class ResumeIngestion:
                 logger.error(f"Error during ainsert: {type(e).__name__}: {e}")
                 raise
             
-            processing_time = (datetime.now() - start_time).total_seconds()
+            processing_time = time.perf_counter() - start_time
             
-            logger.info(f"✅ Ingested: {candidate_name} ({file_type}) in {processing_time:.2f}s")
+            logger.info("✅ Ingested: %s (%s) in %.2fs", candidate_name, file_type, processing_time)
             
             return IngestionResult(
                 file_path=file_path,
@@ -134,7 +137,7 @@ class ResumeIngestion:
             )
             
         except Exception as e:
-            processing_time = (datetime.now() - start_time).total_seconds()
+            processing_time = time.perf_counter() - start_time
             logger.error(f"❌ Failed to ingest {file_path}: {e}")
             
             return IngestionResult(
@@ -156,13 +159,13 @@ class ResumeIngestion:
         
         Args:
             directory: Directory containing resume files
-            batch_size: Number of files to process concurrently
+            batch_size: Maximum number of files in flight at once
             show_progress: Show progress bar
             
         Returns:
             BatchIngestionResult with summary
         """
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         # Get all resume files
         files = get_resume_files(directory)
@@ -181,37 +184,39 @@ class ResumeIngestion:
         # Create progress bar
         pbar = tqdm(total=len(files), desc="Ingesting resumes", disable=not show_progress)
         
-        # Process in batches
-        for i in range(0, len(files), batch_size):
-            batch = files[i:i + batch_size]
-            
-            # Process batch concurrently
-            batch_results = await asyncio.gather(
-                *[self.ingest_single(f) for f in batch],
-                return_exceptions=True
-            )
-            
-            for result in batch_results:
-                if isinstance(result, Exception):
-                    failed += 1
-                    results.append(IngestionResult(
-                        file_path="unknown",
+        # Sliding window: keep up to batch_size files in flight and start the
+        # next one as soon as any finishes, instead of waiting for the slowest
+        # file in each fixed batch. The semaphore bounds memory/LLM pressure.
+        semaphore = asyncio.Semaphore(batch_size)
+        
+        async def _ingest_bounded(file_path: str) -> IngestionResult:
+            async with semaphore:
+                try:
+                    return await self.ingest_single(file_path)
+                except Exception as e:
+                    return IngestionResult(
+                        file_path=file_path,
                         candidate_name="Unknown",
                         success=False,
-                        error=str(result)
-                    ))
-                elif result.success:
-                    successful += 1
-                    results.append(result)
-                else:
-                    failed += 1
-                    results.append(result)
-                
-                pbar.update(1)
+                        error=str(e)
+                    )
+        
+        tasks = [asyncio.create_task(_ingest_bounded(f)) for f in files]
+        
+        for next_done in asyncio.as_completed(tasks):
+            result = await next_done
+            
+            if result.success:
+                successful += 1
+            else:
+                failed += 1
+            results.append(result)
+            
+            pbar.update(1)
         
         pbar.close()
         
-        total_time = (datetime.now() - start_time).total_seconds()
+        total_time = time.perf_counter() - start_time
         
         # Log summary
         logger.info(
@@ -5,6 +5,8 @@ Provides async LLM function compatible with LightRAG's llm_model_func parameter.
 
 import asyncio
 import logging
+import re
+import time
 from typing import Optional, Union, List, Dict, Any
 
 import httpx
@@ -14,10 +16,22 @@ from .config import settings
 
 logger = logging.getLogger(__name__)
 
+# Llama 3.1 extraction clean-up patterns (compiled once, applied per response)
+# "Stutter": a nested "(entity" / "(relation" repeated inside the tuple value
+_STUTTER_FIXES = [
+    (re.compile(r'\("entity"\|\s*"?\s*\(entity"?\s*\|'), '("entity"|"'),
+    (re.compile(r'\("relation"\|\s*"?\s*\(relation"?\s*\|'), '("relationship"|"'),
+    (re.compile(r'\("relationship"\|\s*"?\s*\(relationship"?\s*\|'), '("relationship"|"'),
+]
+_ENTITY_PREFIX_FIX = re.compile(r'^\("entity"\|\s*"?\(entity"?', re.MULTILINE)
+
 
 class OllamaAdapter:
     """Async adapter for Ollama LLM API."""
     
+    # Seconds a health probe result is reused before hitting /api/tags again
+    HEALTH_TTL = 3.0
+    
     def __init__(
         self,
         base_url: str = None,
@@ -32,6 +46,8 @@ class OllamaAdapter:
         self.temperature = temperature or settings.llm_temperature
         self.timeout = timeout if timeout is not None else settings.llm_timeout
         self._client: Optional[httpx.AsyncClient] = None
+        self._health_cache: Optional[tuple] = None  # (checked_at, healthy)
+        self._health_lock = asyncio.Lock()
     
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create async HTTP client."""
@@ -154,12 +170,9 @@ class OllamaAdapter:
                     content = content.replace("```text", "").replace("```", "").strip()
                 
                 # --- 🛑 CRITICAL FIX: CLEANING LOGIC ---
-                import re
-                
                 # 1. Remove the "Stutter" (e.g., "(entity" appearing inside the value)
-                content = re.sub(r'\("entity"\|\s*"?\s*\(entity"?\s*\|', '("entity"|"', content)
-                content = re.sub(r'\("relation"\|\s*"?\s*\(relation"?\s*\|', '("relationship"|"', content)
-                content = re.sub(r'\("relationship"\|\s*"?\s*\(relationship"?\s*\|', '("relationship"|"', content)
+                for pattern, replacement in _STUTTER_FIXES:
+                    content = pattern.sub(replacement, content)
 
                 # 2. Remove standard hallucinations
                 content = content.replace("(entity|", "") 
@@ -170,7 +183,7 @@ class OllamaAdapter:
                 content = content.replace("</s>", "")
                 
                 # Fix Double Quotes issues common in Llama 3 (Backup regex)
-                content = re.sub(r'^\("entity"\|\s*"?\(entity"?', '("entity"|', content, flags=re.MULTILINE)
+                content = _ENTITY_PREFIX_FIX.sub('("entity"|', content)
                 
                 # 🔍 DEBUG: Print AFTER post-processing
                 if "entity" in prompt.lower() or "extract" in prompt.lower():
@@ -180,7 +193,7 @@ class OllamaAdapter:
                     print(content[:2000] if len(content) > 2000 else content)
                     print(f"{'='*60}\n")
 
-            logger.debug(f"LLM response length: {len(content)} chars")
+            logger.debug("LLM response length: %d chars", len(content))
             return content
             
         except httpx.TimeoutException as e:
@@ -192,7 +205,32 @@ class OllamaAdapter:
             raise
     
     async def check_health(self) -> bool:
-        """Check if Ollama is available and model is loaded."""
+        """
+        Check if Ollama is available and model is loaded.
+        
+        Results are cached for HEALTH_TTL seconds, and concurrent callers
+        share a single in-flight probe.
+        """
+        if self._is_health_fresh():
+            return self._health_cache[1]
+        
+        async with self._health_lock:
+            # Another caller may have refreshed while we waited
+            if self._is_health_fresh():
+                return self._health_cache[1]
+            
+            healthy = await self._probe_health()
+            self._health_cache = (time.monotonic(), healthy)
+            return healthy
+    
+    def _is_health_fresh(self) -> bool:
+        return (
+            self._health_cache is not None
+            and time.monotonic() - self._health_cache[0] < self.HEALTH_TTL
+        )
+    
+    async def _probe_health(self) -> bool:
+        """Query /api/tags and check that the configured model is present."""
         try:
             client = await self._get_client()
             response = await client.get("/api/tags")
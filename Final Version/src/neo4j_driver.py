@@ -0,0 +1,80 @@
+"""
+Shared Neo4j driver.
+The async driver owns its own connection pool, so it is created once per
+process and reused by every caller instead of being rebuilt per script run.
+"""
+
+import asyncio
+import logging
+from typing import Optional
+
+from neo4j import AsyncGraphDatabase, AsyncDriver
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+# LightRAG stores every entity as a :base node keyed by entity_id. The range
+# index backs equality lookups; the text index backs CONTAINS / STARTS WITH.
+BASE_ENTITY_INDEXES = [
+    "CREATE INDEX base_entity_id IF NOT EXISTS FOR (n:base) ON (n.entity_id)",
+    "CREATE TEXT INDEX base_entity_id_text IF NOT EXISTS FOR (n:base) ON (n.entity_id)",
+]
+
+_driver: Optional[AsyncDriver] = None
+_driver_lock = asyncio.Lock()
+
+
+async def get_neo4j_driver() -> AsyncDriver:
+    """Get or lazily create the process-wide async Neo4j driver."""
+    global _driver
+    
+    if _driver is not None:
+        return _driver
+    
+    async with _driver_lock:
+        if _driver is None:
+            logger.info(f"Creating Neo4j driver for {settings.neo4j_uri}")
+            _driver = AsyncGraphDatabase.driver(
+                settings.neo4j_uri,
+                auth=(settings.neo4j_username, settings.neo4j_password),
+                max_connection_pool_size=settings.neo4j_max_pool_size,
+                connection_acquisition_timeout=settings.neo4j_acquisition_timeout,
+                max_connection_lifetime=settings.neo4j_max_connection_lifetime,
+            )
+    
+    return _driver
+
+
+async def ensure_neo4j_indexes(database: str = "neo4j") -> int:
+    """
+    Create the :base(entity_id) indexes if they are missing.
+    
+    Args:
+        database: Target Neo4j database
+        
+    Returns:
+        Number of index statements that succeeded
+    """
+    driver = await get_neo4j_driver()
+    created = 0
+    
+    async with driver.session(database=database) as session:
+        for statement in BASE_ENTITY_INDEXES:
+            try:
+                await session.run(statement)
+                created += 1
+            except Exception as e:
+                logger.warning(f"Index creation failed ({statement}): {e}")
+    
+    return created
+
+
+async def close_neo4j_driver():
+    """Close the shared driver (call once on shutdown)."""
+    global _driver
+    
+    if _driver is not None:
+        await _driver.close()
+        _driver = None
+        logger.info("Neo4j driver closed")
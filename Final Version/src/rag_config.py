@@ -190,8 +190,8 @@ class RAGManager:
                             new_results.extend(r.split(marker))
                         results = new_results
                     
-                    # Clean up results
-                    results = [r.strip() for r in results if r.strip()]
+                    # Clean up results (strip each piece once, drop empties)
+                    results = [r for r in (piece.strip() for piece in results) if r]
                     
                     return results
 
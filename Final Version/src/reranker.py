@@ -3,7 +3,9 @@ Cross-encoder reranking model for candidate scoring.
 Uses ms-marco-MiniLM-L-6-v2 for efficient reranking.
 """
 
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Tuple, Optional
 import numpy as np
 
@@ -13,13 +15,21 @@ from .config import settings
 
 logger = logging.getLogger(__name__)
 
+# Dedicated worker for cross-encoder inference. Torch releases the GIL during
+# predict(), so a thread keeps the event loop responsive without reloading the
+# model in every worker process. A single worker serializes access to the model
+# and keeps reranks from crowding out the loop's default executor.
+_rerank_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rerank")
+
 
 class RerankerModel:
     """Cross-encoder reranking model."""
     
-    def __init__(self, model_name: str = None, device: str = None):
+    def __init__(self, model_name: str = None, device: str = None, precision: str = None):
         self.model_name = model_name or settings.rerank_model
         self.device = device
+        self.precision = (precision or settings.rerank_precision).lower()
+        self.batch_size = settings.rerank_batch_size
         self._model: Optional[CrossEncoder] = None
     
     def _ensure_model_loaded(self):
@@ -30,8 +40,27 @@ class RerankerModel:
                 self.model_name,
                 device=self.device
             )
+            if self.precision != "fp32":
+                self._apply_precision()
             logger.info(f"✅ Reranker model loaded")
     
+    def _apply_precision(self):
+        """Cast the cross-encoder weights to a reduced-precision dtype."""
+        import torch
+        
+        dtypes = {"bf16": torch.bfloat16, "fp16": torch.float16}
+        dtype = dtypes.get(self.precision)
+        
+        if dtype is None:
+            logger.warning(f"Unknown rerank precision '{self.precision}', keeping fp32")
+            return
+        if dtype is torch.float16 and not torch.cuda.is_available():
+            logger.warning("fp16 reranking needs CUDA, keeping fp32")
+            return
+        
+        self._model.model.to(dtype)
+        logger.info(f"Reranker weights cast to {self.precision}")
+    
     def rerank(
         self,
         query: str,
@@ -51,8 +80,6 @@ class RerankerModel:
         Returns:
             List of (original_index, score, document) tuples, sorted by score descending
         """
-        self._ensure_model_loaded()
-        
         if not documents:
             return []
         
@@ -60,8 +87,24 @@ class RerankerModel:
         pairs = [[query, doc] for doc in documents]
         
         # Get scores
-        scores = self._model.predict(pairs)
+        scores = self.score_pairs(pairs)
         
+        return self.rank_scores(scores, documents, top_k)
+    
+    def score_pairs(self, pairs: List[List[str]]) -> np.ndarray:
+        """Run the cross-encoder over (query, document) pairs in one call."""
+        self._ensure_model_loaded()
+        # Keep the logits as a tensor: numpy has no bfloat16, so upcast before converting
+        scores = self._model.predict(pairs, batch_size=self.batch_size, convert_to_tensor=True)
+        return scores.float().cpu().numpy()
+    
+    @staticmethod
+    def rank_scores(
+        scores: np.ndarray,
+        documents: List[str],
+        top_k: Optional[int] = None
+    ) -> List[Tuple[int, float, str]]:
+        """Order documents by score, descending, keeping the top_k."""
         # Create indexed results
         results = [(i, float(scores[i]), documents[i]) for i in range(len(documents))]
         
@@ -72,7 +115,7 @@ class RerankerModel:
         if top_k is not None:
             results = results[:top_k]
         
-        logger.debug(f"Reranked {len(documents)} documents, returning top {len(results)}")
+        logger.debug("Reranked %d documents, returning top %d", len(documents), len(results))
         return results
     
     async def arerank(
@@ -81,17 +124,109 @@ class RerankerModel:
         documents: List[str],
         **kwargs
     ) -> List[Tuple[int, float, str]]:
-        """Async wrapper for rerank."""
-        import asyncio
-        loop = asyncio.get_event_loop()
+        """Async wrapper for rerank; runs inference off the event loop."""
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(
-            None, 
+            _rerank_executor,
             lambda: self.rerank(query, documents, **kwargs)
         )
 
 
+class RerankBatcher:
+    """
+    Coalesces concurrent rerank calls into a single cross-encoder forward pass.
+    
+    Requests are queued; a background task collects up to max_batch_requests
+    of them (waiting at most max_wait_ms after the first), scores all their
+    (query, document) pairs together and hands each caller its own slice.
+    """
+    
+    def __init__(
+        self,
+        model: RerankerModel,
+        max_batch_requests: int = None,
+        max_wait_ms: float = None
+    ):
+        self.model = model
+        self.max_batch_requests = max_batch_requests or settings.rerank_batch_max_requests
+        self.max_wait = (max_wait_ms if max_wait_ms is not None else settings.rerank_batch_wait_ms) / 1000
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def _ensure_worker(self):
+        """Start the drain task on the current loop (restarting after asyncio.run cycles)."""
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._worker.done() or self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run())
+    
+    async def submit(
+        self,
+        query: str,
+        documents: List[str],
+        top_k: Optional[int] = None
+    ) -> List[Tuple[int, float, str]]:
+        """Queue a rerank request and wait for its results."""
+        if not documents:
+            return []
+        
+        self._ensure_worker()
+        future = self._loop.create_future()
+        await self._queue.put((query, documents, top_k, future))
+        return await future
+    
+    async def _collect_batch(self) -> list:
+        batch = [await self._queue.get()]
+        deadline = self._loop.time() + self.max_wait
+        
+        while len(batch) < self.max_batch_requests:
+            remaining = deadline - self._loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        
+        return batch
+    
+    async def _run(self):
+        while True:
+            batch = await self._collect_batch()
+            
+            # Flatten every request's pairs; offsets map scores back to callers
+            pairs = []
+            offsets = [0]
+            for query, documents, _, _ in batch:
+                pairs.extend([query, doc] for doc in documents)
+                offsets.append(len(pairs))
+            
+            try:
+                scores = await self._loop.run_in_executor(
+                    _rerank_executor, self.model.score_pairs, pairs
+                )
+            except Exception as e:
+                logger.error(f"Batched rerank failed: {e}")
+                for _, _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            
+            if len(batch) > 1:
+                logger.debug("Coalesced %d rerank calls into one pass (%d pairs)", len(batch), len(pairs))
+            
+            for (_, documents, top_k, future), start, end in zip(batch, offsets, offsets[1:]):
+                if not future.done():
+                    future.set_result(
+                        RerankerModel.rank_scores(scores[start:end], documents, top_k)
+                    )
+
+
 # Global model instance
 _reranker_model: Optional[RerankerModel] = None
+_rerank_batcher: Optional[RerankBatcher] = None
 
 
 def get_reranker_model() -> RerankerModel:
@@ -102,6 +237,14 @@ def get_reranker_model() -> RerankerModel:
     return _reranker_model
 
 
+def get_rerank_batcher() -> RerankBatcher:
+    """Get or create the global rerank batcher."""
+    global _rerank_batcher
+    if _rerank_batcher is None:
+        _rerank_batcher = RerankBatcher(get_reranker_model())
+    return _rerank_batcher
+
+
 async def rerank_func(
     query: str,
     documents: List[str],
@@ -120,8 +263,7 @@ async def rerank_func(
     Returns:
         List of dicts with 'content' and 'score' keys (LightRAG format)
     """
-    model = get_reranker_model()
-    results = await model.arerank(query, documents, top_k=top_n)
+    results = await get_rerank_batcher().submit(query, documents, top_k=top_n)
     
     # Convert tuples to dictionaries for LightRAG compatibility
     return [{"content": r[2], "relevance_score": r[1], "index": r[0]} for r in results]
@@ -3,12 +3,17 @@ Resume parsing utilities for PDF, DOCX, and TXT files.
 """
 
 import os
+import re
 import logging
 from pathlib import Path
 from typing import Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# A name-like line: 2-4 words, each made of letters with optional - or '
+_NAME_WORD = r"[-']*[^\W\d_](?:[^\W\d_]|[-'])*"
+_NAME_LINE_PATTERN = re.compile(rf"{_NAME_WORD}(?:\s+{_NAME_WORD}){{1,3}}")
+
 
 def parse_pdf(file_path: str) -> str:
     """
@@ -32,7 +37,7 @@ def parse_pdf(file_path: str) -> str:
                 text_parts.append(text)
         
         content = "\n".join(text_parts)
-        logger.debug(f"Extracted {len(content)} chars from PDF: {file_path}")
+        logger.debug("Extracted %d chars from PDF: %s", len(content), file_path)
         return content.strip()
         
     except Exception as e:
@@ -68,7 +73,7 @@ def parse_docx(file_path: str) -> str:
                         text_parts.append(cell.text)
         
         content = "\n".join(text_parts)
-        logger.debug(f"Extracted {len(content)} chars from DOCX: {file_path}")
+        logger.debug("Extracted %d chars from DOCX: %s", len(content), file_path)
         return content.strip()
         
     except Exception as e:
@@ -90,7 +95,7 @@ def parse_txt(file_path: str) -> str:
         with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
             content = f.read()
         
-        logger.debug(f"Read {len(content)} chars from TXT: {file_path}")
+        logger.debug("Read %d chars from TXT: %s", len(content), file_path)
         return content.strip()
         
     except Exception as e:
@@ -173,16 +178,14 @@ def extract_candidate_name(content: str, file_path: str) -> str:
     Returns:
         Candidate name
     """
-    # Try to get name from first non-empty line (common pattern)
-    lines = [l.strip() for l in content.split('\n') if l.strip()]
+    # Try to get name from first non-empty line (common pattern).
+    # lstrip() skips leading blank lines, so only that one line is split off
+    # instead of splitting and stripping the whole document.
+    first_line = content.lstrip().split('\n', 1)[0].strip()
     
-    if lines:
-        first_line = lines[0]
-        # If first line looks like a name (2-4 words, no special chars)
-        words = first_line.split()
-        if 2 <= len(words) <= 4:
-            if all(word.replace('-', '').replace("'", '').isalpha() for word in words):
-                return first_line
+    # If first line looks like a name (2-4 words, no special chars)
+    if first_line and _NAME_LINE_PATTERN.fullmatch(first_line):
+        return first_line
     
     # Fall back to filename
     filename = Path(file_path).stem
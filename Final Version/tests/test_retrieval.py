@@ -2,6 +2,9 @@
 Retrieval system tests.
 """
 
+import asyncio
+from types import SimpleNamespace
+
 import pytest
 
 
@@ -17,6 +20,15 @@ class TestResumeParser:
         
         assert name == "John Smith"
     
+    def test_extract_candidate_name_hyphen_apostrophe(self):
+        """Test hyphenated and apostrophe names are accepted after blank lines."""
+        from src.resume_parser import extract_candidate_name
+        
+        content = "\n\n  Mary-Jane O'Neil  \nData Scientist"
+        name = extract_candidate_name(content, "resume.pdf")
+        
+        assert name == "Mary-Jane O'Neil"
+    
     def test_extract_candidate_name_fallback(self):
         """Test name extraction falls back to filename."""
         from src.resume_parser import extract_candidate_name
@@ -53,6 +65,138 @@ class TestDualRetrieval:
         assert "Python" in candidate.content
 
 
+class TestContextCache:
+    """Test the raw-context cache used by chat_with_dual_retrieval."""
+    
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """Fake monotonic clock for the cache, with a small size and TTL."""
+        from src import dual_retrieval
+        
+        now = [1000.0]
+        monkeypatch.setattr(dual_retrieval, "time", SimpleNamespace(monotonic=lambda: now[0]))
+        monkeypatch.setattr(dual_retrieval.settings, "context_cache_size", 2)
+        monkeypatch.setattr(dual_retrieval.settings, "context_cache_ttl", 60.0)
+        dual_retrieval.clear_context_cache()
+        yield now
+        dual_retrieval.clear_context_cache()
+    
+    @pytest.fixture
+    def rag(self, monkeypatch):
+        """Stub RAG counting raw-context retrievals; the LLM call is stubbed too."""
+        from src import llm_adapter
+        
+        async def fake_llm(prompt, **kwargs):
+            return "John Smith has 5 years of Python experience."
+        
+        monkeypatch.setattr(llm_adapter, "ollama_llm_func", fake_llm)
+        
+        class StubRAG:
+            calls = 0
+            
+            async def aquery(self, query, param=None):
+                self.calls += 1
+                return f"John Smith - Python developer (context for {query})"
+        
+        return StubRAG()
+    
+    def test_repeat_query_within_ttl_uses_cache(self, clock, rag):
+        """Test a repeated query inside the TTL skips the retrieval."""
+        from src.dual_retrieval import chat_with_dual_retrieval
+        
+        asyncio.run(chat_with_dual_retrieval(rag, "python developers"))
+        clock[0] += 30
+        asyncio.run(chat_with_dual_retrieval(rag, "python developers"))
+        
+        assert rag.calls == 1
+    
+    def test_expired_entry_is_refetched(self, clock, rag):
+        """Test a query past the TTL retrieves fresh context."""
+        from src.dual_retrieval import chat_with_dual_retrieval
+        
+        asyncio.run(chat_with_dual_retrieval(rag, "python developers"))
+        clock[0] += 61
+        asyncio.run(chat_with_dual_retrieval(rag, "python developers"))
+        
+        assert rag.calls == 2
+    
+    def test_least_recently_used_entry_is_evicted(self, clock):
+        """Test the oldest untouched entry is dropped at capacity."""
+        from src.dual_retrieval import _cache_context, _get_cached_context
+        
+        _cache_context("a", "context a")
+        _cache_context("b", "context b")
+        assert _get_cached_context("a") == "context a"  # "b" is now least recent
+        _cache_context("c", "context c")
+        
+        assert _get_cached_context("b") is None
+        assert _get_cached_context("a") == "context a"
+        assert _get_cached_context("c") == "context c"
+    
+    def test_clear_context_cache_empties_cache(self, clock):
+        """Test clearing the cache (as ingestion does) drops every entry."""
+        from src.dual_retrieval import _cache_context, _get_cached_context, clear_context_cache
+        
+        _cache_context("a", "context a")
+        _cache_context("b", "context b")
+        clear_context_cache()
+        
+        assert _get_cached_context("a") is None
+        assert _get_cached_context("b") is None
+
+
+class TestHybridSearch:
+    """Test BM25 + vector score fusion."""
+    
+    DOCUMENTS = [
+        "Senior Python developer building Django services",
+        "Chef specializing in French cuisine",
+        "Accountant managing ledgers and audits",
+        "Java backend engineer",
+    ]
+    VECTOR_SCORES = [0.9, 0.1, 0.2, 0.5]
+    
+    def test_rank_positions_ranks_positive_scores(self):
+        """Test ranks follow descending score, ties keep order, non-positive scores are unranked."""
+        from src.bm25_search import _rank_positions
+        
+        ranks = _rank_positions([0.2, 0.9, 0.0, -1.0, 0.9])
+        
+        assert ranks == {1: 1, 4: 2, 0: 3}
+    
+    def test_rrf_ranks_document_top_in_both_lists_first(self):
+        """Test a document leading both BM25 and vector rankings wins under RRF."""
+        from src.bm25_search import hybrid_search
+        
+        results = asyncio.run(hybrid_search(
+            "python django", self.DOCUMENTS, self.VECTOR_SCORES, fusion="rrf"
+        ))
+        
+        assert results[0]["index"] == 0
+        assert results[0]["score"] == pytest.approx(0.3 / 61 + 0.5 / 61)
+    
+    def test_rrf_skips_rankings_a_document_is_absent_from(self):
+        """Test a document missing from a ranking gets nothing from that ranking."""
+        from src.bm25_search import hybrid_search
+        
+        results = asyncio.run(hybrid_search(
+            "python django", self.DOCUMENTS, self.VECTOR_SCORES, fusion="rrf"
+        ))
+        by_index = {r["index"]: r["score"] for r in results}
+        
+        # No BM25 match and no graph bonus: only its vector rank (2nd) counts
+        assert by_index[3] == pytest.approx(0.5 / (60 + 2))
+    
+    def test_unknown_fusion_raises(self):
+        """Test an unsupported fusion method is rejected."""
+        from src.bm25_search import hybrid_search
+        
+        with pytest.raises(ValueError):
+            asyncio.run(hybrid_search(
+                "python", self.DOCUMENTS, self.VECTOR_SCORES, fusion="max"
+            ))
+
+
 class TestReranker:
     """Test reranking functionality."""
     
@@ -81,3 +225,97 @@ class TestReranker:
         python_rank = next(i for i, r in enumerate(results) if "Python" in r[2])
         chef_rank = next(i for i, r in enumerate(results) if "Chef" in r[2])
         assert python_rank < chef_rank
+    
+    def test_score_pairs_bf16_returns_float_scores(self):
+        """Test bf16 weights still yield numpy scores (numpy has no bfloat16)."""
+        torch = pytest.importorskip("torch")
+        import numpy as np
+        from src.reranker import RerankerModel
+        
+        class StubCrossEncoder:
+            """Tiny stand-in for CrossEncoder: one linear layer over fixed features."""
+            def __init__(self):
+                self.model = torch.nn.Linear(4, 1)
+            
+            def predict(self, pairs, batch_size=32, convert_to_tensor=False):
+                dtype = next(self.model.parameters()).dtype
+                with torch.no_grad():
+                    logits = self.model(torch.ones(len(pairs), 4, dtype=dtype)).squeeze(-1)
+                return logits if convert_to_tensor else logits.numpy()
+        
+        model = RerankerModel(precision="bf16")
+        model._model = StubCrossEncoder()
+        model._apply_precision()
+        assert next(model._model.model.parameters()).dtype == torch.bfloat16
+        
+        scores = model.score_pairs([["q", "doc a"], ["q", "doc b"]])
+        
+        assert isinstance(scores, np.ndarray)
+        assert scores.dtype == np.float32
+        assert scores.shape == (2,)
+    
+    def _stub_batcher(self, monkeypatch, score_pairs):
+        """Install a batcher whose model scores pairs with score_pairs (no weights loaded)."""
+        from src import reranker
+        
+        model = reranker.RerankerModel()
+        monkeypatch.setattr(model, "score_pairs", score_pairs)
+        batcher = reranker.RerankBatcher(model, max_batch_requests=8, max_wait_ms=50)
+        monkeypatch.setattr(reranker, "_rerank_batcher", batcher)
+    
+    def test_batched_rerank_returns_each_caller_its_slice(self, monkeypatch):
+        """Test concurrent rerank_func calls are coalesced and split back per caller."""
+        from src.reranker import rerank_func
+        
+        calls = []
+        
+        def score_pairs(pairs):
+            calls.append(len(pairs))
+            # Longer documents score higher
+            return [float(len(doc)) for _, doc in pairs]
+        
+        self._stub_batcher(monkeypatch, score_pairs)
+        
+        requests = [
+            ("q1", ["bb", "a", "dddd", "ccc"], 2),
+            ("q2", ["xx", "xxxxx"], 10),
+            ("q3", ["yyy", "y", "yy"], 1),
+        ]
+        
+        async def run():
+            return await asyncio.gather(
+                *(rerank_func(query, docs, top_n=top_n) for query, docs, top_n in requests)
+            )
+        
+        results = asyncio.run(run())
+        
+        # One forward pass over every caller's pairs
+        assert calls == [9]
+        
+        assert [r["content"] for r in results[0]] == ["dddd", "ccc"]
+        assert [r["index"] for r in results[0]] == [2, 3]
+        assert [r["content"] for r in results[1]] == ["xxxxx", "xx"]
+        assert [r["index"] for r in results[1]] == [1, 0]
+        assert [r["content"] for r in results[2]] == ["yyy"]
+        assert results[2][0]["relevance_score"] == 3.0
+    
+    def test_batched_rerank_failure_reaches_every_caller(self, monkeypatch):
+        """Test a scoring error is raised in every request of the failed batch."""
+        from src.reranker import rerank_func
+        
+        def score_pairs(pairs):
+            raise RuntimeError("model exploded")
+        
+        self._stub_batcher(monkeypatch, score_pairs)
+        
+        async def run():
+            return await asyncio.gather(
+                *(rerank_func(f"q{i}", ["doc a", "doc b"]) for i in range(3)),
+                return_exceptions=True
+            )
+        
+        results = asyncio.run(run())
+        
+        assert len(results) == 3
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert all(str(r) == "model exploded" for r in results)
@@ -1,4 +1,5 @@
 import os
+import asyncio
 import uvicorn
 from fastapi import FastAPI, HTTPException, BackgroundTasks, UploadFile, File
 from pydantic import BaseModel
@@ -6,7 +7,7 @@ from typing import List, Optional
 from contextlib import asynccontextmanager
 
 from src.rag_engine import initialize_rag
-from src.job_manager import process_top_candidates, chat_with_shortlist
+from src.job_manager import process_top_candidates, chat_with_shortlist, get_job_cache_stats
 from rank_candidates import retrieve_candidates_vector_only
 from lightrag.utils import logger
 import logging
@@ -100,6 +101,17 @@ async def chat_job(request: JobChatRequest):
         logger.error(f"Error in chat_job: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/job_cache_stats")
+async def job_cache_stats():
+    """
+    Shortlist cache size and hit rate (observability).
+    """
+    return get_job_cache_stats()
+
+def _write_bytes(path: str, data: bytes):
+    with open(path, "wb") as f:
+        f.write(data)
+
 @app.post("/ingest")
 async def ingest_resume(file: UploadFile = File(...)):
     """
@@ -111,9 +123,9 @@ async def ingest_resume(file: UploadFile = File(...)):
         
     file_path = os.path.join(save_dir, file.filename)
     try:
-        with open(file_path, "wb") as f:
-            content = await file.read()
-            f.write(content)
+        content = await file.read()
+        # Disk write runs in a worker thread so uploads don't block the event loop
+        await asyncio.to_thread(_write_bytes, file_path, content)
             
         # LIVE INGESTION: Immediately index the file so it is searchable
         if rag_instance:
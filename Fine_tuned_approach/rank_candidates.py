@@ -2,6 +2,7 @@ import asyncio
 import argparse
 import json
 import re
+from functools import lru_cache
 from lightrag import LightRAG, QueryParam
 from src.rag_engine import initialize_rag
 from src.query_processor import extract_keywords
@@ -18,6 +19,35 @@ DOMAIN_NEGATIVES = {
     "data": ["sales associate", "customer service", "receptionist"],
 }
 
+# Optional: Aho-Corasick scans each resume once regardless of how many terms are checked
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+
+@lru_cache(maxsize=32)
+def _build_term_matcher(terms: tuple):
+    """
+    Returns a function text -> list of terms found in text (in `terms` order).
+    Built once per distinct term set.
+    """
+    if not HAS_AHOCORASICK:
+        return lambda text: [term for term in terms if term in text]
+
+    automaton = ahocorasick.Automaton()
+    for idx, term in enumerate(terms):
+        automaton.add_word(term, idx)
+    automaton.make_automaton()
+
+    def match(text: str) -> list:
+        found = {idx for _, idx in automaton.iter(text)}
+        return [terms[idx] for idx in sorted(found)]
+
+    return match
+
+
 def apply_domain_guard(query: str, candidates: list) -> list:
     """
     Penalizes candidates who have high frequency of negative keywords for the specific query domain.
@@ -35,13 +65,16 @@ def apply_domain_guard(query: str, candidates: list) -> list:
 
     print(f"Domain Guard Active: Blocking {negative_terms[:3]}...")
     
+    # Overlapping domains (engineer/developer) share terms; match each once
+    find_negative_terms = _build_term_matcher(tuple(dict.fromkeys(negative_terms)))
+    
     filtered_candidates = []
     for cand in candidates:
         text = cand['resume_text'].lower()
         penalty_score = 0
         
         # Check for presence of negative terms
-        matches = [term for term in negative_terms if term in text]
+        matches = find_negative_terms(text)
         
         # If specific "kill words" are found, heavily penalize
         if len(matches) > 0:
@@ -131,16 +164,20 @@ async def retrieve_candidates_vector_only(query: str, top_k: int = 20) -> list:
     # We need to preserve the source_file metadata.
     # We'll map by content matching.
     
+    # Index the pool by text once (first occurrence wins, as before) so each
+    # reranked result is an O(1) lookup instead of a scan of the whole pool.
+    candidates_by_text = {}
+    for c in candidates_pool:
+        candidates_by_text.setdefault(c['resume_text'], c)
+    
     found_contents = set()
     
     for r in reranked_results:
         r_content = r['content']
-        for c in candidates_pool:
-            if c['resume_text'] == r_content:
-                if r_content not in found_contents:
-                    final_candidates.append(c)
-                    found_contents.add(r_content)
-                break
+        c = candidates_by_text.get(r_content)
+        if c is not None and r_content not in found_contents:
+            final_candidates.append(c)
+            found_contents.add(r_content)
                 
     num_dropped = len(candidates_pool) - len(final_candidates)
     if num_dropped > 0:
@@ -170,17 +207,11 @@ async def get_ranked_candidates_async(query: str, top_k: int = 5):
     
     if not candidates:
         return []
-        
-    print("Stage 3: Cross-Encoder Re-Ranking...")
-    resume_texts = [c['resume_text'] for c in candidates]
-    reranked = await local_rerank_func(query, resume_texts, top_n=top_k)
-    
-    final = []
-    for r in reranked:
-        for c in candidates:
-            if c['resume_text'] == r['content']:
-                final.append(c)
-                break
+    
+    # retrieve_candidates_vector_only already cross-encodes, thresholds and
+    # orders the pool by reranker score, so a second rerank of the same texts
+    # would reproduce that order; just take the top_k.
+    final = candidates[:top_k]
                 
     # LLM Insight (Stage 4 in original flow)
     # ... (LLM Logic)
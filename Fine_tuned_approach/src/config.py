@@ -36,3 +36,9 @@ class Config:
 
     TOP_K = 5
     RERANK_THRESHOLD = 0.2 # Increased to 0.2 to filter noise in hybrid mode
+
+    # Job shortlist cache (bounded so abandoned jobs don't leak memory)
+    JOB_CACHE_MAXSIZE = int(os.getenv("JOB_CACHE_MAXSIZE", "1024"))
+    JOB_CACHE_TTL = int(os.getenv("JOB_CACHE_TTL", "3600"))  # seconds
+    # Set to share shortlists across API workers (e.g. redis://localhost:6379/0)
+    REDIS_URL = os.getenv("REDIS_URL")
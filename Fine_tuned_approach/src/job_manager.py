@@ -4,14 +4,156 @@ import shutil
 import asyncio
 import json
 import re
-from typing import List, Dict
+import time
+from collections import OrderedDict
+from typing import List, Dict, Optional
 from lightrag import LightRAG, QueryParam
 from lightrag.llm.openai import gpt_4o_complete, gpt_4o_mini_complete
 from .config import Config
 from .rag_engine import initialize_rag
 
+# Optional: Redis lets several API workers share job shortlists
+try:
+    import redis.asyncio as aioredis
+    HAS_REDIS = True
+except ImportError:
+    HAS_REDIS = False
+
+class JobShortlistCache:
+    """
+    Bounded LRU cache with per-entry TTL for job shortlists.
+    Least recently used jobs are evicted once maxsize is reached,
+    and entries older than ttl seconds are treated as missing.
+    """
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()  # job_id -> (expires_at, value)
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, job_id: str, default=None):
+        value = self._lookup(job_id)
+        if value is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        return value
+    
+    def _lookup(self, job_id: str):
+        """Return the live entry (refreshing its LRU position) or None."""
+        entry = self._data.get(job_id)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._data[job_id]
+            return None
+        self._data.move_to_end(job_id)
+        return value
+    
+    def __setitem__(self, job_id: str, value):
+        self._data[job_id] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(job_id)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def __contains__(self, job_id: str) -> bool:
+        return self._lookup(job_id) is not None
+    
+    def __delitem__(self, job_id: str):
+        del self._data[job_id]
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    def stats(self) -> Dict[str, float]:
+        """Size and hit-rate counters for monitoring."""
+        lookups = self.hits + self.misses
+        return {
+            "backend": "memory",
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+class RedisJobShortlistStore:
+    """
+    Redis-backed job shortlist store. Entries expire natively after ttl
+    seconds and are visible to every worker pointing at the same Redis.
+    """
+    
+    def __init__(self, url: str, ttl: int):
+        self.ttl = ttl
+        self._redis = aioredis.from_url(url)
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def _key(job_id: str) -> str:
+        return f"job:{job_id}"
+    
+    async def get(self, job_id: str, default=None):
+        raw = await self._redis.get(self._key(job_id))
+        if raw is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        return json.loads(raw)
+    
+    async def set(self, job_id: str, value):
+        await self._redis.set(self._key(job_id), json.dumps(value), ex=self.ttl)
+    
+    async def delete(self, job_id: str):
+        await self._redis.delete(self._key(job_id))
+    
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "backend": "redis",
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
 # Modified Cache: Key: job_id, Value: List[Dict] with 'name' and 'text'
-_job_shortlists: Dict[str, List[Dict[str, str]]] = {}
+_job_shortlists = JobShortlistCache(maxsize=Config.JOB_CACHE_MAXSIZE, ttl=Config.JOB_CACHE_TTL)
+
+# Shared store used instead of the in-process cache when REDIS_URL is set
+_redis_shortlists: Optional[RedisJobShortlistStore] = None
+if Config.REDIS_URL:
+    if HAS_REDIS:
+        _redis_shortlists = RedisJobShortlistStore(Config.REDIS_URL, ttl=Config.JOB_CACHE_TTL)
+    else:
+        print("Warning: REDIS_URL is set but the 'redis' package is not installed; using in-memory shortlists.")
+
+
+async def _store_shortlist(job_id: str, candidates: List[Dict[str, str]]):
+    if _redis_shortlists is not None:
+        await _redis_shortlists.set(job_id, candidates)
+    else:
+        _job_shortlists[job_id] = candidates
+
+async def _load_shortlist(job_id: str) -> List[Dict[str, str]]:
+    if _redis_shortlists is not None:
+        return await _redis_shortlists.get(job_id, [])
+    return _job_shortlists.get(job_id, [])
+
+async def _drop_shortlist(job_id: str):
+    if _redis_shortlists is not None:
+        await _redis_shortlists.delete(job_id)
+    elif job_id in _job_shortlists:
+        del _job_shortlists[job_id]
+
+# Candidate name line in a resume profile ("Name: Jane Doe")
+_NAME_RE = re.compile(r"Name:\s*(.*)")
 
 # Global RAG Instance Cache
 _global_rag: LightRAG = None
@@ -26,6 +168,13 @@ async def get_global_rag() -> LightRAG:
         _global_rag = await initialize_rag()
     return _global_rag
 
+def _extract_candidate_name(text: str) -> str:
+    """Pull the candidate name from a profile, falling back to a short preview."""
+    match = _NAME_RE.search(text)
+    if match:
+        return match.group(1).strip()
+    return text[:30].replace('\n', ' ').strip() + "..."
+
 async def process_top_candidates(job_id: str, top_20_texts: List[str]):
     """
     Stage 2: The "Context Filter".
@@ -33,18 +182,12 @@ async def process_top_candidates(job_id: str, top_20_texts: List[str]):
     """
     print(f"Assigning {len(top_20_texts)} candidates to Job {job_id} context...")
     
-    candidates_data = []
-    for text in top_20_texts:
-        # Extract Name
-        match = re.search(r"Name:\s*(.*)", text)
-        if match:
-            name = match.group(1).strip()
-        else:
-            name = text[:30].replace('\n', ' ').strip() + "..."
-            
-        candidates_data.append({"name": name, "text": text})
+    candidates_data = [
+        {"name": _extract_candidate_name(text), "text": text}
+        for text in top_20_texts
+    ]
             
-    _job_shortlists[job_id] = candidates_data
+    await _store_shortlist(job_id, candidates_data)
     print(f"Job {job_id} Context Set ({len(candidates_data)} profiles cached).")
     
     return "Context Set"
@@ -64,7 +207,7 @@ async def chat_with_shortlist(job_id: str, user_question: str, mode: str = "mix"
     """
     rag = await get_global_rag()
     
-    candidates = _job_shortlists.get(job_id, [])
+    candidates = await _load_shortlist(job_id)
     if not candidates:
         print(f"Warning: No shortlist found for Job {job_id}.")
         context_prompt = ""
@@ -122,11 +265,18 @@ async def chat_with_shortlist(job_id: str, user_question: str, mode: str = "mix"
             return "System Warning: No response generated. This typically happens if the database is empty. Please run ingestion to populate the Knowledge Graph."
 
 
+def get_job_cache_stats() -> Dict[str, float]:
+    """
+    Returns size and hit-rate statistics for the job shortlist cache.
+    """
+    if _redis_shortlists is not None:
+        return _redis_shortlists.stats()
+    return _job_shortlists.stats()
+
 async def clear_job_data(job_id: str):
     """
-    Cleanup: Just removes the shortlist from memory.
+    Cleanup: Just removes the shortlist from the job store.
     """
-    if job_id in _job_shortlists:
-        del _job_shortlists[job_id]
+    await _drop_shortlist(job_id)
     print(f"Cleared context for Job {job_id}")
 
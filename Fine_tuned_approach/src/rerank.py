@@ -1,4 +1,5 @@
 from typing import List
+import numpy as np
 from lightrag.utils import logger
 from sentence_transformers import CrossEncoder
 from .config import Config
@@ -40,31 +41,24 @@ async def local_rerank_func(query: str, documents: List[str], **kwargs) -> List[
         raw_scores = model.predict(pairs)
         
         # Apply Sigmoid to convert Logits -> Probability (0 to 1)
-        import numpy as np
-        scores = 1 / (1 + np.exp(-raw_scores))
+        scores = 1 / (1 + np.exp(-np.asarray(raw_scores, dtype=np.float32)))
         
-        # Combine documents with NORMALIZED scores
-        scored_docs = list(zip(documents, scores))
-        
-        # Sort by score in descending order
-        scored_docs.sort(key=lambda x: x[1], reverse=True)
+        # Sort by score in descending order (stable, so ties keep input order)
+        order = np.argsort(-scores, kind="stable")
 
-        # DEBUG: Log top 5 scores to see what we are dealing with
         # DEBUG: Log top candidates to verify retrieval quality
-        if scored_docs:
+        if len(order):
              logger.info("--- RERANKER TOP CANDIDATES ---")
-             for i, (text, score) in enumerate(scored_docs[:3]):
-                 snippet = text[:100].replace('\n', ' ')
-                 logger.info(f"Rank {i+1}: Score={score:.4f} | Content='{snippet}...'")
+             for i, idx in enumerate(order[:3]):
+                 snippet = documents[idx][:100].replace('\n', ' ')
+                 logger.info(f"Rank {i+1}: Score={scores[idx]:.4f} | Content='{snippet}...'")
              logger.info("-------------------------------")
         
         # FILTER: Keep only documents with score > THRESHOLD
         # This prevents returning irrelevant results even if top_k is high
         threshold = getattr(Config, 'RERANK_THRESHOLD', 0.15)
-        filtered_docs = [
-            doc for doc, score in scored_docs 
-            if score >= threshold
-        ]
+        kept = order[scores[order] >= threshold]
+        filtered_docs = [documents[idx] for idx in kept]
         
         logger.info(f"Rerank Filter: {len(documents)} -> {len(filtered_docs)} candidates (Threshold: {threshold})")
 
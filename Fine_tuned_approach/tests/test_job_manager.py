@@ -0,0 +1,145 @@
+"""
+Job shortlist cache tests.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake monotonic clock for the shortlist cache."""
+    from src import job_manager
+    
+    now = [1000.0]
+    monkeypatch.setattr(job_manager, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+class FakeRedis:
+    """Minimal async stand-in for redis.asyncio (bytes in, bytes out)."""
+    
+    def __init__(self):
+        self.data = {}
+    
+    async def get(self, key):
+        return self.data.get(key)
+    
+    async def set(self, key, value, ex=None):
+        self.data[key] = value.encode("utf-8") if isinstance(value, str) else value
+    
+    async def delete(self, key):
+        self.data.pop(key, None)
+
+
+SHORTLIST = [
+    {"name": "Jane Doe", "text": "Name: Jane Doe\nSkills: Python, SQL"},
+    {"name": "José Álvarez", "text": "Name: José Álvarez\n10 años de experiencia"},
+]
+
+
+class TestJobShortlistCache:
+    """Test the in-memory LRU/TTL shortlist cache."""
+    
+    def test_evicts_least_recently_used_at_maxsize(self, clock):
+        """Test the oldest untouched job is dropped once maxsize is exceeded."""
+        from src.job_manager import JobShortlistCache
+        
+        cache = JobShortlistCache(maxsize=2, ttl=60)
+        cache["a"] = ["a"]
+        cache["b"] = ["b"]
+        assert cache.get("a") == ["a"]  # "b" is now least recent
+        cache["c"] = ["c"]
+        
+        assert len(cache) == 2
+        assert "b" not in cache
+        assert "a" in cache
+        assert "c" in cache
+    
+    def test_entries_expire_after_ttl(self, clock):
+        """Test an entry is served before its TTL and treated as missing after."""
+        from src.job_manager import JobShortlistCache
+        
+        cache = JobShortlistCache(maxsize=10, ttl=60)
+        cache["job"] = ["x"]
+        
+        clock[0] += 59
+        assert cache.get("job") == ["x"]
+        clock[0] += 1
+        assert cache.get("job", []) == []
+        assert len(cache) == 0
+    
+    def test_stats_count_hits_and_misses(self, clock):
+        """Test get() updates the counters reported by stats()."""
+        from src.job_manager import JobShortlistCache
+        
+        cache = JobShortlistCache(maxsize=10, ttl=60)
+        cache["job"] = ["x"]
+        cache.get("job")
+        cache.get("job")
+        cache.get("other")
+        
+        stats = cache.stats()
+        assert stats["backend"] == "memory"
+        assert stats["size"] == 1
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == pytest.approx(2 / 3)
+    
+    def test_drop_removes_entry(self, clock, monkeypatch):
+        """Test _drop_shortlist removes a stored in-memory shortlist."""
+        from src import job_manager
+        
+        monkeypatch.setattr(job_manager, "_job_shortlists", job_manager.JobShortlistCache(maxsize=10, ttl=60))
+        monkeypatch.setattr(job_manager, "_redis_shortlists", None)
+        
+        async def run():
+            await job_manager._store_shortlist("job", SHORTLIST)
+            stored = await job_manager._load_shortlist("job")
+            await job_manager._drop_shortlist("job")
+            return stored, await job_manager._load_shortlist("job")
+        
+        stored, after_drop = asyncio.run(run())
+        
+        assert stored == SHORTLIST
+        assert after_drop == []
+        assert len(job_manager._job_shortlists) == 0
+
+
+class TestRedisJobShortlistStore:
+    """Test the Redis-backed shortlist store against a fake client."""
+    
+    @pytest.fixture
+    def store(self, monkeypatch):
+        from src import job_manager
+        
+        fake = FakeRedis()
+        monkeypatch.setattr(job_manager, "aioredis", SimpleNamespace(from_url=lambda url: fake), raising=False)
+        store = job_manager.RedisJobShortlistStore("redis://fake", ttl=60)
+        monkeypatch.setattr(job_manager, "_redis_shortlists", store)
+        return store
+    
+    def test_shortlist_round_trips_through_json(self, store):
+        """Test a shortlist survives _store_shortlist/_load_shortlist unchanged."""
+        from src import job_manager
+        
+        async def run():
+            await job_manager._store_shortlist("job", SHORTLIST)
+            return await job_manager._load_shortlist("job")
+        
+        assert asyncio.run(run()) == SHORTLIST
+        assert store.stats()["hits"] == 1
+    
+    def test_drop_removes_entry(self, store):
+        """Test _drop_shortlist deletes the Redis key."""
+        from src import job_manager
+        
+        async def run():
+            await job_manager._store_shortlist("job", SHORTLIST)
+            await job_manager._drop_shortlist("job")
+            return await job_manager._load_shortlist("job")
+        
+        assert asyncio.run(run()) == []
+        assert store.stats()["misses"] == 1
@@ -3,17 +3,27 @@ FastAPI Backend for ATS Pipeline
 """
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from ats_pipeline.config import Config
 from .routes import router
+from .middleware import TimingMiddleware
 import logging
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Skip schema generation and the docs UI in production
+IS_PROD = Config.ENVIRONMENT == "prod"
+
 app = FastAPI(
     title="ATS Hybrid Pipeline API",
     description="API for Applicant Tracking System with Hybrid Search and RAG",
-    version="2.0.0"
+    version="2.0.0",
+    default_response_class=ORJSONResponse,
+    docs_url=None if IS_PROD else "/docs",
+    redoc_url=None if IS_PROD else "/redoc",
+    openapi_url=None if IS_PROD else "/openapi.json"
 )
 
 # CORS Configuration
@@ -25,13 +35,18 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Request timing (pure ASGI, no BaseHTTPMiddleware overhead)
+app.add_middleware(TimingMiddleware)
+
 # Include routes
 app.include_router(router, prefix="/api/v1")
 
-@app.get("/")
+# Probe endpoints return pre-built responses so FastAPI skips its
+# serialization/validation pass on every poll
+@app.get("/", response_model=None)
 async def root():
-    return {"message": "ATS Hybrid Pipeline API is running"}
+    return ORJSONResponse({"message": "ATS Hybrid Pipeline API is running"})
 
-@app.get("/health")
+@app.get("/health", response_model=None)
 async def health_check():
-    return {"status": "healthy"}
+    return ORJSONResponse({"status": "healthy"})
@@ -0,0 +1,45 @@
+"""
+ASGI middleware for the ATS API
+"""
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class TimingMiddleware:
+    """
+    Pure ASGI middleware that logs request latency and adds an
+    X-Process-Time header. Avoids BaseHTTPMiddleware's per-request
+    task and stream wrapping.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                elapsed = time.perf_counter() - start
+                headers = list(message.get("headers", []))
+                headers.append((b"x-process-time", f"{elapsed:.4f}".encode()))
+                message["headers"] = headers
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            logger.info(
+                "%s %s -> %d (%.1f ms)",
+                scope["method"], scope["path"], status_code,
+                (time.perf_counter() - start) * 1000,
+            )
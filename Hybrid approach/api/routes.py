@@ -2,6 +2,7 @@
 API Routes for ATS Pipeline
 """
 from fastapi import APIRouter, HTTPException, UploadFile, File, BackgroundTasks
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 from ats_pipeline import get_pipeline, SearchFilters, CandidateMatch
@@ -31,7 +32,14 @@ class ChatRequest(BaseModel):
     message: str
 
 # Routes
-@router.post("/search", response_model=List[CandidateMatch])
+# Matches are already validated CandidateMatch instances, so skip FastAPI's
+# response_model re-validation and serialize them directly. `responses` keeps
+# the schema in the OpenAPI docs.
+@router.post(
+    "/search",
+    response_model=None,
+    responses={200: {"model": List[CandidateMatch]}}
+)
 async def search_candidates(request: SearchRequest):
     """Search for candidates"""
     try:
@@ -41,7 +49,7 @@ async def search_candidates(request: SearchRequest):
             filters=request.filters,
             use_llm_explanations=request.use_llm_explanations
         )
-        return matches
+        return ORJSONResponse([match.model_dump() for match in matches])
     except Exception as e:
         logger.error(f"Search failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
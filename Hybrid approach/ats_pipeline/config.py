@@ -35,6 +35,9 @@ class Config:
     BATCH_SIZE: int = 10
     ENABLE_CACHE: bool = True
     
+    # Deployment ("dev" or "prod"); prod hides the interactive API docs
+    ENVIRONMENT: str = os.getenv("ATS_ENV", "dev").lower()
+    
     @classmethod
     def validate(cls) -> bool:
         """Validate that required configuration is present"""
@@ -67,12 +67,14 @@ class GraphDatabaseManager:
             with self.driver.session() as session:
                 session.run(query, dimensions=Config.EMBEDDING_DIMENSIONS)
                 
-                # Verify index exists
-                result = session.run("SHOW INDEXES")
-                for record in result:
-                    if record['name'] == 'candidate_embedding_idx':
-                        logger.info("✅ Vector index created/verified")
-                        return True
+                # Verify index exists (filtered server-side; no per-index records)
+                found = session.run(
+                    "SHOW INDEXES YIELD name WHERE name = $name RETURN count(*) AS n",
+                    name='candidate_embedding_idx'
+                ).single()['n']
+                if found:
+                    logger.info("✅ Vector index created/verified")
+                    return True
                         
             logger.warning("⚠️ Vector index creation command succeeded but index not found. Vector search will be disabled.")
             return False
@@ -235,7 +237,7 @@ class GraphDatabaseManager:
         try:
             with self.driver.session() as session:
                 result = session.run(query, embedding=query_embedding, top_k=top_k)
-                return [dict(record) for record in result]
+                return result.data()
         except Exception as e:
             logger.error(f"Vector search failed: {e}")
             return []
@@ -262,9 +264,11 @@ class GraphDatabaseManager:
         if filters.required_skills:
             query_parts.append("""
             MATCH (c)-[:HAS_SKILL]->(s:Skill)
-            WHERE toLower(s.name) IN $required_skills
+            WHERE s.name IN $required_skills
             WITH c, count(DISTINCT s) as skill_matches
             """)
+            # Skill names are stored lowercased (see add_candidate), so compare
+            # the raw property and let the planner seek skill_name_idx
             where_clauses.append("skill_matches >= $min_skill_matches")
             params['required_skills'] = [s.lower() for s in filters.required_skills]
             # Relaxed matching: Require only 50% of skills to match
@@ -302,7 +306,7 @@ class GraphDatabaseManager:
         
         with self.driver.session() as session:
             result = session.run(query, **params)
-            return [dict(record) for record in result]
+            return result.data()
     
     def get_candidate_skills(self, candidate_id: str) -> List[str]:
         """Get all skills for a candidate"""
@@ -313,23 +317,21 @@ class GraphDatabaseManager:
         
         with self.driver.session() as session:
             result = session.run(query, candidate_id=candidate_id)
-            return [record['skill'] for record in result]
+            return result.value('skill')
     
     def get_database_stats(self) -> Dict[str, Any]:
         """Get database statistics"""
-        queries = {
-            'total_candidates': "MATCH (c:Candidate) RETURN count(c) as count",
-            'total_skills': "MATCH (s:Skill) RETURN count(s) as count",
-            'total_companies': "MATCH (comp:Company) RETURN count(comp) as count",
-        }
+        # One round-trip; each label count is answered from the count store.
+        # Independent subqueries so a label with no nodes still yields 0
+        query = """
+        CALL { MATCH (c:Candidate) RETURN count(c) AS total_candidates }
+        CALL { MATCH (s:Skill) RETURN count(s) AS total_skills }
+        CALL { MATCH (comp:Company) RETURN count(comp) AS total_companies }
+        RETURN total_candidates, total_skills, total_companies
+        """
         
-        stats = {}
         with self.driver.session() as session:
-            for key, query in queries.items():
-                result = session.run(query)
-                stats[key] = result.single()['count']
-        
-        return stats
+            return session.run(query).single().data()
 
 # Global instance
 _graph_db: Optional[GraphDatabaseManager] = None